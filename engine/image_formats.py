@@ -0,0 +1,16 @@
+"""
+Supported image formats.
+
+Kept free of heavy imports so the GUI can filter files without loading
+Pillow or llama-cpp-python.
+"""
+
+from pathlib import Path
+
+# Supported image file extensions
+IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".webp", ".bmp", ".tiff", ".tif", ".gif"})
+
+
+def is_image_file(path: Path) -> bool:
+    """Check if a file path has a supported image extension."""
+    return path.suffix.lower() in IMAGE_EXTENSIONS
@@ -2,33 +2,50 @@
 Qwen3-VL GGUF Inference Engine
 
 Provides GPU-accelerated vision-language model inference using llama-cpp-python.
-Supports single image captioning with streaming token output and configurable
-generation parameters. Thread-safe for Qt signal integration.
+Supports single image and batch captioning with streaming token output and
+configurable generation parameters. Thread-safe for Qt signal integration.
 """
 
-import base64
+import binascii
 import io
 import os
+import re
 import sys
+import tempfile
+import threading
 import time
 import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 
 from PIL import Image
 
+# Re-exported for existing callers; defined in a light module for the GUI
+from engine.image_formats import IMAGE_EXTENSIONS, is_image_file
+
+# Match app.py's QImageReader.setAllocationLimit(0): large camera photos are
+# expected input, so don't trip Pillow's decompression-bomb check on them.
+Image.MAX_IMAGE_PIXELS = None
+
+# Handles returned by os.add_dll_directory — kept alive for the process lifetime
+_dll_directory_handles = []
+
 
 def _setup_cuda_dll_path():
     """
-    Manually preload CUDA DLLs using ctypes before llama.cpp initialization.
+    Make the CUDA runtime DLLs resolvable before llama.cpp initialization.
 
     On Windows, llama-cpp-python with CUDA support requires CUDA runtime DLLs
     (cudart64_12.dll, cublas64_12.dll, etc.) to be loaded. When launching
     the GUI via double-click, the CUDA bin directory may not be in PATH, causing
     "access violation reading 0x0000000000000000" errors during llama_backend_init().
 
-    We manually preload the DLLs using ctypes.CDLL() to ensure they're loaded
-    into the process before llama.cpp tries to use them.
+    We register the CUDA bin directory with os.add_dll_directory() so the
+    Windows loader can resolve every transitively-referenced CUDA DLL (nvrtc,
+    cufft, ...), not just the few we know about. Manual ctypes.CDLL()
+    preloading is kept as a fallback for interpreters without that API.
     """
     if sys.platform != "win32":
         return  # Only needed on Windows
@@ -55,14 +72,22 @@ def _setup_cuda_dll_path():
     if not cuda_bin:
         return  # No CUDA found, will fall back to CPU
 
-    # Critical CUDA DLLs that must be preloaded
+    if hasattr(os, "add_dll_directory"):
+        for dll_dir in (cuda_bin, cuda_bin.parent / "libnvvp"):
+            if dll_dir.is_dir():
+                try:
+                    _dll_directory_handles.append(os.add_dll_directory(str(dll_dir)))
+                except OSError:
+                    pass
+        return
+
+    # Fallback: preload the critical CUDA DLLs using ctypes
     critical_dlls = [
         "cudart64_12.dll",
         "cublas64_12.dll",
         "cublasLt64_12.dll",
     ]
 
-    # Preload DLLs using ctypes
     import ctypes
     for dll_name in critical_dlls:
         dll_path = cuda_bin / dll_name
@@ -83,14 +108,86 @@ try:
 except ImportError:
     LLAMA_CPP_AVAILABLE = False
 
+# Optional SIMD resampler (AVX2/NEON); falls back to Pillow's scalar Lanczos
+try:
+    from pic_scale import resize as _ps_resize, Resampling as _PSResampling
+    PIC_SCALE_AVAILABLE = True
+except ImportError:
+    PIC_SCALE_AVAILABLE = False
+
+
+# Chat-template noise VLMs often prepend ("Answer:", "Caption:", "Sure," ...)
+_CAPTION_PREFIX_RE = re.compile(
+    r"^(?:answer:|caption:|description:|response:|here is|here's|sure[,.])",
+    re.IGNORECASE,
+)
+_LEADING_PUNCT = ":;-–—.*• \t\n"
+
+
+# Formats the vision encoder decodes natively (stb_image) -> MIME subtype.
+# Small files in these formats are sent as-is instead of being re-encoded.
+# WEBP is deliberately absent: stb_image cannot decode it.
+_PASSTHROUGH_FORMATS = {"JPEG": "jpeg", "PNG": "png"}
+_PASSTHROUGH_MODES = {"RGB", "RGBA", "L"}
+
+# Precomputed data-URI headers, one per MIME subtype we can emit
+_URI_PREFIXES = {
+    mime: f"data:image/{mime};base64,".encode("ascii")
+    for mime in ("jpeg", *_PASSTHROUGH_FORMATS.values())
+}
+
+
+def _prepare_image(image_path: Path, max_dim: int) -> Tuple[Optional[Image.Image], str]:
+    """
+    Open an image and downscale it so neither side exceeds max_dim.
+
+    Only the header is read until we know pixels are needed. Returns
+    (None, mime) when the file is already small enough and in a format the
+    vision encoder can consume verbatim (no decode/re-encode needed),
+    otherwise (rgb_image, "jpeg").
+    """
+    img = Image.open(image_path)
+    
+    w, h = img.size
+    mime = _PASSTHROUGH_FORMATS.get(img.format)
+    if (
+        w <= max_dim and h <= max_dim
+        and mime is not None and img.mode in _PASSTHROUGH_MODES
+    ):
+        return None, mime
+    
+    if img.mode != "RGB":
+        img = img.convert("RGB")  # skip the full-frame copy for RGB sources
+    
+    # Resize if any dimension exceeds max_dim
+    if w > max_dim or h > max_dim:
+        scale = max_dim / max(w, h)
+        new_w = int(w * scale)
+        new_h = int(h * scale)
+        if PIC_SCALE_AVAILABLE:
+            img = _ps_resize(img, (new_w, new_h), _PSResampling.LANCZOS, workers=0)
+        else:
+            img = img.resize((new_w, new_h), Image.LANCZOS)
+    return img, "jpeg"
+
+
+# Per-thread scratch buffer for JPEG encoding (batch prefetch runs on a pool)
+_tls = threading.local()
 
-# Supported image file extensions
-IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".bmp", ".tiff", ".tif", ".gif"}
 
+def _get_encode_buffer() -> io.BytesIO:
+    """Return this thread's reusable BytesIO, emptied and rewound."""
+    buffer = getattr(_tls, "buffer", None)
+    if buffer is None:
+        buffer = _tls.buffer = io.BytesIO()
+    buffer.seek(0)
+    buffer.truncate(0)
+    return buffer
 
-def is_image_file(path: Path) -> bool:
-    """Check if a file path has a supported image extension."""
-    return path.suffix.lower() in IMAGE_EXTENSIONS
+
+def _save_jpeg(img: Image.Image, fp) -> None:
+    """Encode as JPEG (much cheaper than PNG/DEFLATE for photos)."""
+    img.save(fp, format="JPEG", quality=92, subsampling=0, optimize=False)
 
 
 def image_to_data_uri(image_path: Path, max_dim: int = 1280) -> str:
@@ -103,23 +200,45 @@ def image_to_data_uri(image_path: Path, max_dim: int = 1280) -> str:
         max_dim: Maximum dimension (width or height) to resize to.
         
     Returns:
-        A data URI string like 'data:image/png;base64,...'
+        A data URI string like 'data:image/jpeg;base64,...'
+    """
+    img, mime = _prepare_image(image_path, max_dim)
+    if img is None:
+        b64 = binascii.b2a_base64(Path(image_path).read_bytes(), newline=False)
+    else:
+        buffer = _get_encode_buffer()
+        _save_jpeg(img, buffer)
+        # Encode straight from the buffer's memory (no getvalue() copy); the
+        # view must be released before the buffer can be truncated again
+        with buffer.getbuffer() as view:
+            b64 = binascii.b2a_base64(view, newline=False)
+    return (_URI_PREFIXES[mime] + b64).decode("ascii")
+
+
+def image_to_file_uri(image_path: Path, max_dim: int = 1280) -> Tuple[str, Optional[Path]]:
     """
-    img = Image.open(image_path).convert("RGB")
+    Like image_to_data_uri, but hands the chat handler a file:// URI so it
+    can read the pixels straight from disk instead of base64-decoding them.
     
-    # Resize if any dimension exceeds max_dim
-    w, h = img.size
-    if w > max_dim or h > max_dim:
-        scale = max_dim / max(w, h)
-        new_w = int(w * scale)
-        new_h = int(h * scale)
-        img = img.resize((new_w, new_h), Image.LANCZOS)
+    Args:
+        image_path: Path to the image file.
+        max_dim: Maximum dimension (width or height) to resize to.
+        
+    Returns:
+        (uri, temp_path) — temp_path is the resized temporary JPEG the caller
+        must delete once inference is done, or None if the original file
+        was used directly.
+    """
+    image_path = Path(image_path)
+    img, _ = _prepare_image(image_path, max_dim)
+    if img is None:
+        return image_path.resolve().as_uri(), None
     
-    # Convert to PNG bytes then base64
-    buffer = io.BytesIO()
-    img.save(buffer, format="PNG")
-    b64 = base64.b64encode(buffer.getvalue()).decode("utf-8")
-    return f"data:image/png;base64,{b64}"
+    # delete=False: Windows cannot reopen a NamedTemporaryFile while it's open
+    with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as tmp:
+        _save_jpeg(img, tmp)
+    tmp_path = Path(tmp.name)
+    return tmp_path.as_uri(), tmp_path
 
 
 class Qwen3VLEngine:
@@ -140,6 +259,7 @@ class Qwen3VLEngine:
         self.mmproj_path: Optional[Path] = None
         self._is_loaded = False
         self._last_inference_time: float = 0.0
+        self._last_load_time: float = 0.0
     
     @property
     def is_loaded(self) -> bool:
@@ -156,6 +276,16 @@ class Qwen3VLEngine:
         mmproj_path: str | Path,
         n_ctx: int = 8192,
         n_gpu_layers: int = -1,
+        n_batch: int = 2048,
+        n_ubatch: int = 512,
+        n_threads_batch: Optional[int] = None,
+        flash_attn: bool = True,
+        tensor_split: Optional[List[float]] = None,
+        main_gpu: int = 0,
+        split_mode: int = 1,
+        use_mmap: bool = True,
+        use_mlock: bool = False,
+        numa: bool = True,
         verbose: bool = False,
         progress_callback: Optional[Callable[[str], None]] = None,
     ) -> None:
@@ -167,6 +297,22 @@ class Qwen3VLEngine:
             mmproj_path: Path to the mmproj vision encoder .gguf file.
             n_ctx: Context window size (tokens).
             n_gpu_layers: Number of layers to offload to GPU (-1 = all).
+            n_batch: Logical batch size for prompt processing. Image prompts
+                inject thousands of tokens at once; larger batches mean larger
+                GEMMs during prefill.
+            n_ubatch: Physical (micro) batch size; clamped to n_batch.
+            n_threads_batch: CPU threads for batch processing (None = auto).
+            flash_attn: Use the fused flash-attention kernel.
+            tensor_split: Relative share of the model per GPU, e.g. [1.0, 1.0]
+                for an even two-card split (None = llama.cpp's default,
+                proportional to free VRAM).
+            main_gpu: GPU used for scratch buffers and small tensors.
+            split_mode: 0 = single GPU, 1 = split layers, 2 = split rows.
+            use_mmap: Memory-map the GGUF so weights are paged in lazily
+                while being copied to VRAM (explicit: some Windows builds
+                default to False).
+            use_mlock: Pin the model in RAM.
+            numa: Enable NUMA-aware CPU thread placement.
             verbose: Enable llama.cpp verbose logging.
             progress_callback: Optional callback for status messages.
         """
@@ -201,13 +347,25 @@ class Qwen3VLEngine:
             progress_callback("Loading language model (this may take a minute)...")
 
         # Load the main model with GPU acceleration
+        load_start = time.perf_counter()
         self.model = Llama(
             model_path=str(model_path),
             n_ctx=n_ctx,
             n_gpu_layers=n_gpu_layers,  # Use GPU acceleration
+            n_batch=n_batch,
+            n_ubatch=min(n_ubatch, n_batch),
+            n_threads_batch=n_threads_batch,
+            flash_attn=flash_attn,
+            tensor_split=tensor_split,
+            main_gpu=main_gpu,
+            split_mode=split_mode,
+            use_mmap=use_mmap,
+            use_mlock=use_mlock,
+            numa=numa,
             chat_handler=self.chat_handler,
             verbose=verbose,
         )
+        self._last_load_time = time.perf_counter() - load_start
         
         self.model_path = model_path
         self.mmproj_path = mmproj_path
@@ -254,9 +412,107 @@ class Qwen3VLEngine:
         if not image_path.exists():
             raise FileNotFoundError(f"Image not found: {image_path}")
         
-        # Convert image to data URI
-        image_uri = image_to_data_uri(image_path)
+        # Hand the resized image to the chat handler as a file:// URI —
+        # avoids a base64 encode here and a base64 decode in llama.cpp
+        image_uri, tmp_path = image_to_file_uri(image_path)
+        try:
+            caption = self._generate(
+                image_uri, prompt, system_prompt, temperature, top_p,
+                max_tokens, stream_callback, cancel_check,
+            )
+        finally:
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+        
+        return self._postprocess_caption(caption, prefix, suffix)
+    
+    def caption_images(
+        self,
+        image_paths: Iterable[str | Path],
+        prompt: str,
+        system_prompt: str = "You are a helpful assistant that describes images accurately and in detail.",
+        temperature: float = 0.6,
+        top_p: float = 0.9,
+        max_tokens: int = 1024,
+        prefix: str = "",
+        suffix: str = "",
+        stream_callback: Optional[Callable[[str], None]] = None,
+        cancel_check: Optional[Callable[[], bool]] = None,
+        prefetch: int = 2,
+    ) -> Iterator[Tuple[Path, str]]:
+        """
+        Caption a sequence of images, yielding (path, caption) as each finishes.
+        
+        Image preprocessing (decode, resize, JPEG encode) for the next
+        *prefetch* images runs on worker threads while the GPU generates the
+        current caption, so batch throughput approaches the slower of the two
+        stages instead of their sum. Generation itself stays on the calling
+        thread since Llama is not thread-safe.
         
+        Args:
+            image_paths: Image files to caption, in order.
+            prefetch: How many images to preprocess ahead of the current one.
+            Remaining arguments are the same as caption_image().
+            
+        Yields:
+            (image_path, caption) tuples in input order.
+        """
+        if not self.is_loaded:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+        
+        paths = iter([Path(p) for p in image_paths])
+        pending: deque = deque()  # (path, Future[(uri, tmp_path)])
+        
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, prefetch)) as pool:
+                def _submit_next():
+                    path = next(paths, None)
+                    if path is not None:
+                        pending.append((path, pool.submit(image_to_file_uri, path)))
+                
+                # Bounded lookahead: current image + `prefetch` in flight
+                for _ in range(prefetch + 1):
+                    _submit_next()
+                
+                while pending:
+                    if cancel_check and cancel_check():
+                        break
+                    
+                    path, future = pending.popleft()
+                    _submit_next()
+                    
+                    image_uri, tmp_path = future.result()
+                    try:
+                        caption = self._generate(
+                            image_uri, prompt, system_prompt, temperature, top_p,
+                            max_tokens, stream_callback, cancel_check,
+                        )
+                    finally:
+                        if tmp_path is not None:
+                            tmp_path.unlink(missing_ok=True)
+                    
+                    yield path, self._postprocess_caption(caption, prefix, suffix)
+        finally:
+            # Remove temp files of images that were prefetched but never used
+            for _, future in pending:
+                if future.cancelled() or future.exception() is not None:
+                    continue
+                _, tmp_path = future.result()
+                if tmp_path is not None:
+                    tmp_path.unlink(missing_ok=True)
+    
+    def _generate(
+        self,
+        image_uri: str,
+        prompt: str,
+        system_prompt: str,
+        temperature: float,
+        top_p: float,
+        max_tokens: int,
+        stream_callback: Optional[Callable[[str], None]],
+        cancel_check: Optional[Callable[[], bool]],
+    ) -> str:
+        """Run one chat completion for an already-prepared image URI."""
         # Build the chat messages with image
         messages = [
             {"role": "system", "content": system_prompt},
@@ -272,8 +528,8 @@ class Qwen3VLEngine:
         start_time = time.perf_counter()
         
         if stream_callback:
-            # Streaming mode
-            caption_parts = []
+            # Streaming mode — accumulate into one growing buffer
+            buf = io.StringIO()
             
             response = self.model.create_chat_completion(
                 messages=messages,
@@ -290,10 +546,10 @@ class Qwen3VLEngine:
                 delta = chunk.get("choices", [{}])[0].get("delta", {})
                 token_text = delta.get("content", "")
                 if token_text:
-                    caption_parts.append(token_text)
+                    buf.write(token_text)
                     stream_callback(token_text)
             
-            caption = "".join(caption_parts).strip()
+            caption = buf.getvalue().strip()
         else:
             # Non-streaming mode
             response = self.model.create_chat_completion(
@@ -307,21 +563,16 @@ class Qwen3VLEngine:
             caption = response["choices"][0]["message"]["content"].strip()
         
         self._last_inference_time = time.perf_counter() - start_time
-        
+        return caption
+    
+    @staticmethod
+    def _postprocess_caption(caption: str, prefix: str, suffix: str) -> str:
+        """Strip chat-template noise and apply the fixed prefix/suffix."""
         # --- Clean up chat-template artifacts ---
-        # VLMs often prepend formatting noise like ":", "Answer:", "Caption:", etc.
-        # Strip known prefixes first, then any leftover leading punctuation.
-        _strip_prefixes = [
-            "answer:", "caption:", "description:", "response:",
-            "here is", "here's", "sure,", "sure.",
-        ]
-        cleaned = caption
-        for pfx in _strip_prefixes:
-            if cleaned.lower().startswith(pfx):
-                cleaned = cleaned[len(pfx):]
-                break
-        # Strip any remaining leading colons, dashes, dots, asterisks, whitespace
-        cleaned = cleaned.lstrip(":;-–—.*• \t\n")
+        # Strip a known prefix first (single anchored regex, no full-string
+        # lowercase copy), then any leftover leading colons, dashes, dots,
+        # asterisks and whitespace.
+        cleaned = _CAPTION_PREFIX_RE.sub("", caption, count=1).lstrip(_LEADING_PUNCT)
         if cleaned:
             caption = cleaned
         
@@ -345,16 +596,11 @@ class Qwen3VLEngine:
         self.model_path = None
         self.mmproj_path = None
         
-        # Force garbage collection to free VRAM
+        # Force garbage collection so llama.cpp releases its VRAM buffers.
+        # (llama.cpp has its own CUDA allocator — torch.cuda.empty_cache()
+        # would not reclaim anything and importing torch costs seconds.)
         import gc
         gc.collect()
-        
-        try:
-            import torch
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
-        except ImportError:
-            pass
     
     def get_model_info(self) -> dict:
         """Return a dictionary with model metadata for the status panel."""
@@ -365,5 +611,6 @@ class Qwen3VLEngine:
             "status": "Loaded",
             "model_file": self.model_path.name if self.model_path else "unknown",
             "mmproj_file": self.mmproj_path.name if self.mmproj_path else "unknown",
+            "load_time_s": round(self._last_load_time, 2),
             "last_inference_s": round(self._last_inference_time, 2),
         }
@@ -2,24 +2,31 @@
 Auto-download utility for the Qwen3-VL mmproj (vision encoder) GGUF file.
 
 On first run, if the mmproj file is not found next to the main model,
-this module downloads it from HuggingFace Hub.
+this module downloads it from HuggingFace Hub. When the main model is
+missing as well, both are fetched concurrently in one snapshot download.
 """
 
+import importlib.util
 import os
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Iterable, List, Optional, Tuple
 
 
 # Primary repo: the user's abliterated model (has matching mmproj files)
 MMPROJ_REPO_ID = "prithivMLmods/Qwen3-VL-8B-Instruct-abliterated-v1-GGUF"
-MMPROJ_FILENAME = "Qwen3-VL-8B-Instruct-abliterated-v1.mmproj-f16.gguf"
+
+# Available vision encoder precisions in the primary repo.
+# Q8_0 is the default: the ViT forward pass is memory-bandwidth bound, so
+# half the bytes per layer means roughly half the VRAM and a faster embed.
+MMPROJ_FILENAMES = {
+    "Q8_0": "Qwen3-VL-8B-Instruct-abliterated-v1.mmproj-Q8_0.gguf",
+    "F16": "Qwen3-VL-8B-Instruct-abliterated-v1.mmproj-f16.gguf",
+}
+DEFAULT_MMPROJ_QUANT = "Q8_0"
+MMPROJ_FILENAME = MMPROJ_FILENAMES[DEFAULT_MMPROJ_QUANT]
 
 # Fallback repos to try if the primary one fails
 FALLBACK_REPOS = [
-    (
-        "prithivMLmods/Qwen3-VL-8B-Instruct-abliterated-v1-GGUF",
-        "Qwen3-VL-8B-Instruct-abliterated-v1.mmproj-Q8_0.gguf",
-    ),
     (
         "bartowski/Qwen3-VL-8B-Instruct-GGUF",
         "Qwen3-VL-8B-Instruct-mmproj-f16.gguf",
@@ -31,13 +38,28 @@ FALLBACK_REPOS = [
 ]
 
 
-def find_mmproj_file(model_dir: Path) -> Optional[Path]:
+def enable_hf_transfer() -> None:
+    """
+    Turn on HuggingFace's multi-connection Rust downloader if installed.
+
+    huggingface_hub reads HF_HUB_ENABLE_HF_TRANSFER once at import time, so
+    this must run before the first ``import huggingface_hub``. Setting the
+    flag without hf_transfer installed makes every download fail, hence the
+    availability check.
+    """
+    if importlib.util.find_spec("hf_transfer") is not None:
+        os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+
+def find_mmproj_file(model_dir: Path, quant: str = DEFAULT_MMPROJ_QUANT) -> Optional[Path]:
     """
     Search for an existing mmproj file in the given directory.
     Looks for files matching common mmproj naming patterns.
     
     Args:
         model_dir: Directory to search in.
+        quant: Preferred precision ("Q8_0" or "F16"). A file matching it is
+            returned first; otherwise any mmproj file is accepted.
         
     Returns:
         Path to the mmproj file if found, None otherwise.
@@ -45,17 +67,34 @@ def find_mmproj_file(model_dir: Path) -> Optional[Path]:
     if not model_dir.is_dir():
         return None
     
+    quant_lower = quant.lower()
+    fallback = None
     for f in model_dir.iterdir():
         name_lower = f.name.lower()
         if f.is_file() and f.suffix == ".gguf" and "mmproj" in name_lower:
-            return f
+            if quant_lower in name_lower:
+                return f
+            if fallback is None:
+                fallback = f
     
-    return None
+    return fallback
+
+
+def _mmproj_attempts(quant: str) -> List[Tuple[str, str]]:
+    """Ordered (repo_id, filename) pairs to try, preferred precision first."""
+    preferred = MMPROJ_FILENAMES.get(quant, MMPROJ_FILENAME)
+    others = [fn for fn in MMPROJ_FILENAMES.values() if fn != preferred]
+    return (
+        [(MMPROJ_REPO_ID, preferred)]
+        + [(MMPROJ_REPO_ID, fn) for fn in others]
+        + FALLBACK_REPOS
+    )
 
 
 def download_mmproj(
     target_dir: Path,
     progress_callback: Optional[Callable[[str, float], None]] = None,
+    quant: str = DEFAULT_MMPROJ_QUANT,
 ) -> Path:
     """
     Download the mmproj vision encoder GGUF from HuggingFace Hub.
@@ -65,6 +104,7 @@ def download_mmproj(
     Args:
         target_dir: Directory to save the downloaded file.
         progress_callback: Called with (message, progress_fraction) during download.
+        quant: Preferred precision ("Q8_0" or "F16").
         
     Returns:
         Path to the downloaded mmproj file.
@@ -72,6 +112,7 @@ def download_mmproj(
     Raises:
         RuntimeError: If download fails from all sources.
     """
+    enable_hf_transfer()
     try:
         from huggingface_hub import hf_hub_download
     except ImportError:
@@ -84,7 +125,7 @@ def download_mmproj(
     target_dir.mkdir(parents=True, exist_ok=True)
     
     # Try primary repo first, then fallbacks
-    attempts = [(MMPROJ_REPO_ID, MMPROJ_FILENAME)] + FALLBACK_REPOS
+    attempts = _mmproj_attempts(quant)
     
     for repo_id, filename in attempts:
         try:
@@ -95,7 +136,6 @@ def download_mmproj(
                 repo_id=repo_id,
                 filename=filename,
                 local_dir=str(target_dir),
-                local_dir_use_symlinks=False,
             )
             
             result_path = Path(downloaded_path)
@@ -116,13 +156,71 @@ def download_mmproj(
         f"  {target_dir}\n\n"
         "Recommended file:\n"
         "  https://huggingface.co/prithivMLmods/Qwen3-VL-8B-Instruct-abliterated-v1-GGUF\n"
-        "  -> Qwen3-VL-8B-Instruct-abliterated-v1.mmproj-f16.gguf"
+        f"  -> {MMPROJ_FILENAME}"
     )
 
 
+def download_model_bundle(
+    target_dir: Path,
+    repo_id: str,
+    patterns: Iterable[str],
+    progress_callback: Optional[Callable[[str, float], None]] = None,
+    token: Optional[str] = None,
+) -> Path:
+    """
+    Download several files from one HuggingFace repo concurrently.
+    
+    Uses snapshot_download, which fetches matching files (and shards of
+    split GGUFs) in parallel rather than one after another.
+    
+    Args:
+        target_dir: Directory to save the downloaded files.
+        repo_id: HuggingFace repo to download from.
+        patterns: Filenames or glob patterns to include.
+        progress_callback: Called with (message, progress_fraction) during download.
+        token: Optional HuggingFace token for gated repos.
+        
+    Returns:
+        The target directory.
+        
+    Raises:
+        RuntimeError: If huggingface-hub is not installed.
+    """
+    enable_hf_transfer()
+    try:
+        from huggingface_hub import snapshot_download
+    except ImportError:
+        raise RuntimeError(
+            "huggingface-hub is not installed. Run:\n"
+            "  pip install huggingface-hub"
+        )
+    
+    target_dir = Path(target_dir)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    patterns = list(patterns)
+    
+    if progress_callback:
+        progress_callback(f"Downloading {len(patterns)} files from {repo_id}...", 0.1)
+    
+    snapshot_download(
+        repo_id=repo_id,
+        allow_patterns=patterns,
+        local_dir=str(target_dir),
+        max_workers=8,
+        token=token,
+    )
+    
+    if progress_callback:
+        progress_callback("Download complete", 1.0)
+    
+    return target_dir
+
+
 def ensure_mmproj(
     model_dir: Path,
     progress_callback: Optional[Callable[[str, float], None]] = None,
+    quant: str = DEFAULT_MMPROJ_QUANT,
+    model_filename: Optional[str] = None,
 ) -> Path:
     """
     Ensure the mmproj file exists. If not found, download it.
@@ -132,11 +230,14 @@ def ensure_mmproj(
     Args:
         model_dir: Directory containing the main GGUF model.
         progress_callback: Optional progress callback.
+        quant: Preferred vision encoder precision ("Q8_0" or "F16").
+        model_filename: Main model file from MMPROJ_REPO_ID. If given and
+            missing from model_dir too, it is downloaded alongside the mmproj.
         
     Returns:
         Path to the mmproj file (existing or newly downloaded).
     """
-    existing = find_mmproj_file(model_dir)
+    existing = find_mmproj_file(model_dir, quant)
     if existing:
         if progress_callback:
             progress_callback(f"Found existing mmproj: {existing.name}", 1.0)
@@ -145,4 +246,18 @@ def ensure_mmproj(
     if progress_callback:
         progress_callback("mmproj file not found. Downloading...", 0.0)
     
-    return download_mmproj(model_dir, progress_callback)
+    if model_filename and not (Path(model_dir) / model_filename).is_file():
+        try:
+            mmproj_filename = MMPROJ_FILENAMES.get(quant, MMPROJ_FILENAME)
+            download_model_bundle(
+                model_dir, MMPROJ_REPO_ID, [model_filename, mmproj_filename],
+                progress_callback,
+            )
+            found = find_mmproj_file(model_dir, quant)
+            if found:
+                return found
+        except Exception as e:
+            if progress_callback:
+                progress_callback(f"Bundle download failed: {e}. Trying mmproj only...", 0.0)
+    
+    return download_mmproj(model_dir, progress_callback, quant)
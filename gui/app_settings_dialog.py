@@ -4,35 +4,140 @@ Application Settings Dialog for VL-CAPTIONER Studio Pro.
 Provides:
   - Dark / Light theme toggle
   - HuggingFace token input (for gated model downloads)
+  - Vision encoder (mmproj) precision: Q8_0 or F16
+  - Extra folders to search for .gguf model files
+  - Advanced inference knobs (prompt batch sizes, flash attention,
+    multi-GPU split)
+  - GPU status refresh interval
   - Persistent storage via gui.config
 """
 
-from PyQt6.QtCore import Qt, pyqtSignal
+import copy
+from typing import Iterable, List
+
+from PyQt6.QtCore import (
+    Qt, QAbstractListModel, QModelIndex, QTimer, pyqtSignal,
+)
+from PyQt6.QtGui import QGuiApplication
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QLineEdit, QCheckBox, QFrame, QWidget,
+    QLineEdit, QCheckBox, QComboBox, QFrame, QWidget, QListView,
+    QFileDialog, QAbstractItemView, QScrollArea,
 )
 
-from gui.config import load_config, save_config
-from gui.theme import COLORS
+from gui.config import (
+    get_gpu_poll_interval_ms, load_config, parse_tensor_split, update_config,
+)
+
+
+# Space left for the window frame/title bar when capping the dialog height
+_SCREEN_MARGIN = 60
+
+
+class _PathListModel(QAbstractListModel):
+    """Flat list of folder paths, handed to the view in pages via fetchMore()."""
+
+    PAGE_SIZE = 200
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._paths: List[str] = []
+        self._loaded = 0   # rows currently exposed to the view
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return self._paths[index.row()]
+        return None
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        return not parent.isValid() and self._loaded < len(self._paths)
+
+    def fetchMore(self, parent: QModelIndex):
+        count = min(self.PAGE_SIZE, len(self._paths) - self._loaded)
+        if parent.isValid() or count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def set_paths(self, paths: Iterable[str]):
+        self.beginResetModel()
+        self._paths = list(paths)
+        self._loaded = min(self.PAGE_SIZE, len(self._paths))
+        self.endResetModel()
+
+    def paths(self) -> List[str]:
+        return list(self._paths)
+
+    def append(self, path: str):
+        if self._loaded < len(self._paths):
+            self._paths.append(path)   # picked up by a later fetchMore()
+            return
+        row = len(self._paths)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._paths.append(path)
+        self._loaded += 1
+        self.endInsertRows()
+
+    def remove_rows(self, rows: Iterable[int]) -> List[str]:
+        """Remove *rows*, one begin/endRemoveRows per contiguous run."""
+        removed: List[str] = []
+        ordered = sorted(set(rows), reverse=True)
+        i = 0
+        while i < len(ordered):
+            last = first = ordered[i]
+            while i + 1 < len(ordered) and ordered[i + 1] == first - 1:
+                i += 1
+                first = ordered[i]
+            self.beginRemoveRows(QModelIndex(), first, last)
+            removed.extend(self._paths[first:last + 1])
+            del self._paths[first:last + 1]
+            self._loaded -= last - first + 1
+            self.endRemoveRows()
+            i += 1
+        return removed
 
 
 class AppSettingsDialog(QDialog):
     """Modal settings dialog opened by the gear icon."""
 
     theme_changed = pyqtSignal(str)   # "dark" or "light"
+    poll_interval_changed = pyqtSignal(int)   # GPU refresh period in ms
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Settings")
-        self.setFixedSize(450, 340)
-        self.setStyleSheet(
-            f"QDialog {{ background-color: {COLORS['bg_darkest']}; "
-            f"border: 1px solid {COLORS['border_light']}; border-radius: 10px; }}"
-        )
+        self.setMinimumWidth(450)
+        self.setObjectName("appSettingsDialog")
+
+        # Config is read on first show so the dialog appears without disk I/O
+        self._cfg = {}
+        self._original_cfg = {}
+        self._paths_set = set()     # mirrors _paths_model for O(1) duplicate checks
+        self._paths_dirty = False   # set once the user adds or removes a folder
+        self._loaded = False
+        self._token_visible = False
+        self._last_emitted_mode = "dark"
+
+        # Rapid toggles collapse into one restyle of the whole app
+        self._theme_timer = QTimer(self)
+        self._theme_timer.setSingleShot(True)
+        self._theme_timer.setInterval(120)
+        self._theme_timer.timeout.connect(self._emit_theme_if_changed)
 
-        self._cfg = load_config()
         self._build_ui()
+        self._fit_to_content()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._loaded:
+            self._loaded = True
+            self._load_settings()
 
     # ------------------------------------------------------------------ #
     # UI
@@ -45,51 +150,52 @@ class AppSettingsDialog(QDialog):
 
         # --- Title ---
         title = QLabel("Settings")
-        title.setStyleSheet(
-            f"color: {COLORS['text_primary']}; font-size: 16px; "
-            f"font-weight: 700; background: transparent; margin-bottom: 4px;"
-        )
+        title.setProperty("class", "dialog-title")
         root.addWidget(title)
 
         subtitle = QLabel("Configure application preferences")
-        subtitle.setStyleSheet(
-            f"color: {COLORS['text_dim']}; font-size: 11px; background: transparent;"
-        )
+        subtitle.setProperty("class", "dialog-subtitle")
         root.addWidget(subtitle)
         root.addSpacing(16)
 
+        # Sections scroll between the fixed title and footer, so adding an
+        # option never pushes Save/Cancel off a short screen
+        outer = root
+        self._body = QWidget()
+        self._body.setObjectName("appSettingsBody")
+        root = QVBoxLayout(self._body)
+        root.setContentsMargins(0, 0, 0, 0)
+        root.setSpacing(0)
+
+        self._scroll = QScrollArea()
+        self._scroll.setObjectName("appSettingsScroll")
+        self._scroll.setWidgetResizable(True)
+        self._scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self._scroll.setWidget(self._body)
+        outer.addWidget(self._scroll, 1)
+
         # --- Theme Section ---
         root.addWidget(self._section_header("APPEARANCE"))
         root.addSpacing(6)
 
         theme_row = QHBoxLayout()
         theme_label = QLabel("Dark Mode")
-        theme_label.setStyleSheet(
-            f"color: {COLORS['text_secondary']}; font-size: 12px; background: transparent;"
-        )
+        theme_label.setProperty("class", "settings-label")
         theme_row.addWidget(theme_label)
         theme_row.addStretch()
 
         self._dark_mode_cb = QCheckBox()
-        self._dark_mode_cb.setChecked(self._cfg.get("theme", "dark") == "dark")
         self._dark_mode_cb.stateChanged.connect(self._on_theme_toggled)
         theme_row.addWidget(self._dark_mode_cb)
 
         root.addLayout(theme_row)
 
         theme_note = QLabel("Some changes may require an app restart for full effect.")
-        theme_note.setStyleSheet(
-            f"color: {COLORS['text_muted']}; font-size: 10px; "
-            f"background: transparent; padding-left: 2px;"
-        )
+        theme_note.setProperty("class", "settings-note")
         root.addWidget(theme_note)
         root.addSpacing(16)
 
-        # --- Separator ---
-        sep = QFrame()
-        sep.setFixedHeight(1)
-        sep.setStyleSheet(f"background: {COLORS['border']};")
-        root.addWidget(sep)
+        root.addWidget(self._separator())
         root.addSpacing(16)
 
         # --- HuggingFace Token Section ---
@@ -97,9 +203,7 @@ class AppSettingsDialog(QDialog):
         root.addSpacing(6)
 
         token_desc = QLabel("API token for downloading gated or private models")
-        token_desc.setStyleSheet(
-            f"color: {COLORS['text_dim']}; font-size: 11px; background: transparent;"
-        )
+        token_desc.setProperty("class", "settings-desc")
         root.addWidget(token_desc)
         root.addSpacing(6)
 
@@ -109,17 +213,7 @@ class AppSettingsDialog(QDialog):
         self._token_input = QLineEdit()
         self._token_input.setPlaceholderText("hf_xxxxxxxxxxxxxxxxxxxxxxxx")
         self._token_input.setEchoMode(QLineEdit.EchoMode.Password)
-        self._token_input.setText(self._cfg.get("hf_token", ""))
-        self._token_input.setStyleSheet(
-            f"QLineEdit {{"
-            f"  background-color: {COLORS['bg_dark']};"
-            f"  color: {COLORS['text_primary']};"
-            f"  border: 1px solid {COLORS['border']};"
-            f"  border-radius: 6px; padding: 8px;"
-            f"  font-family: 'Consolas', monospace; font-size: 12px;"
-            f"}}"
-            f"QLineEdit:focus {{ border-color: {COLORS['accent']}; }}"
-        )
+        self._token_input.setObjectName("hfToken")
         token_row.addWidget(self._token_input, 1)
 
         # Show/Hide toggle
@@ -127,19 +221,119 @@ class AppSettingsDialog(QDialog):
         self._show_token_btn.setFixedSize(34, 34)
         self._show_token_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self._show_token_btn.setToolTip("Show / Hide token")
-        self._show_token_btn.setStyleSheet(
-            f"QPushButton {{ background: {COLORS['bg_hover']}; border: 1px solid {COLORS['border']}; "
-            f"border-radius: 6px; font-size: 14px; }}"
-            f"QPushButton:hover {{ background: {COLORS['bg_surface']}; }}"
-        )
+        self._show_token_btn.setObjectName("showTokenButton")
         self._show_token_btn.clicked.connect(self._toggle_token_visibility)
         token_row.addWidget(self._show_token_btn)
 
         root.addLayout(token_row)
+        root.addSpacing(16)
+
+        root.addWidget(self._separator())
+        root.addSpacing(16)
+
+        # --- Vision Encoder Section ---
+        root.addWidget(self._section_header("VISION ENCODER"))
+        root.addSpacing(6)
+
+        quant_row = QHBoxLayout()
+        quant_label = QLabel("mmproj precision")
+        quant_label.setProperty("class", "settings-label")
+        quant_row.addWidget(quant_label)
+        quant_row.addStretch()
+
+        self._mmproj_combo = QComboBox()
+        self._mmproj_combo.addItems(["Q8_0", "F16"])
+        quant_row.addWidget(self._mmproj_combo)
+
+        root.addLayout(quant_row)
+
+        quant_note = QLabel("Q8_0 uses about half the VRAM of F16. Applies on next model load.")
+        quant_note.setProperty("class", "settings-note")
+        root.addWidget(quant_note)
+        root.addSpacing(16)
+
+        root.addWidget(self._separator())
+        root.addSpacing(16)
+
+        # --- Model Folders Section ---
+        root.addWidget(self._section_header("MODEL FOLDERS"))
+        root.addSpacing(6)
+
+        paths_desc = QLabel("Extra folders searched for .gguf model files")
+        paths_desc.setProperty("class", "settings-desc")
+        root.addWidget(paths_desc)
+        root.addSpacing(6)
+
+        self._paths_model = _PathListModel(self)
+        self._paths_list = QListView()
+        self._paths_list.setModel(self._paths_model)
+        self._paths_list.setUniformItemSizes(True)
+        self._paths_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self._paths_list.setFixedHeight(84)
+        self._paths_list.setObjectName("modelPaths")
+        root.addWidget(self._paths_list)
+        root.addSpacing(6)
+
+        paths_btn_row = QHBoxLayout()
+        paths_btn_row.setSpacing(6)
+        paths_btn_row.addStretch()
+
+        add_path_btn = QPushButton("+ Add Folder")
+        add_path_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        add_path_btn.setProperty("class", "path-button")
+        add_path_btn.clicked.connect(self._add_search_path)
+        paths_btn_row.addWidget(add_path_btn)
+
+        remove_path_btn = QPushButton("Remove")
+        remove_path_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        remove_path_btn.setProperty("class", "path-button-danger")
+        remove_path_btn.clicked.connect(self._remove_search_path)
+        paths_btn_row.addWidget(remove_path_btn)
+
+        root.addLayout(paths_btn_row)
+        root.addSpacing(16)
+
+        root.addWidget(self._separator())
+        root.addSpacing(16)
+
+        # --- Advanced Section ---
+        root.addWidget(self._section_header("ADVANCED"))
+        root.addSpacing(6)
+
+        self._n_batch_combo = QComboBox()
+        self._n_batch_combo.addItems(["512", "1024", "2048", "4096"])
+        root.addLayout(self._labeled_row("Prompt batch (n_batch)", self._n_batch_combo))
+        root.addSpacing(6)
+
+        self._n_ubatch_combo = QComboBox()
+        self._n_ubatch_combo.addItems(["256", "512", "1024", "2048"])
+        root.addLayout(self._labeled_row("Micro batch (n_ubatch)", self._n_ubatch_combo))
+        root.addSpacing(6)
+
+        self._flash_attn_cb = QCheckBox()
+        root.addLayout(self._labeled_row("Flash attention", self._flash_attn_cb))
+        root.addSpacing(6)
+
+        self._tensor_split_input = QLineEdit()
+        self._tensor_split_input.setPlaceholderText("auto  (e.g. 1,1)")
+        self._tensor_split_input.setFixedWidth(140)
+        root.addLayout(self._labeled_row("Multi-GPU split", self._tensor_split_input))
+        root.addSpacing(6)
+
+        self._main_gpu_combo = QComboBox()
+        self._main_gpu_combo.addItems(["0", "1", "2", "3"])
+        root.addLayout(self._labeled_row("Main GPU", self._main_gpu_combo))
+        root.addSpacing(6)
+
+        self._gpu_poll_combo = QComboBox()
+        self._gpu_poll_combo.addItems(["2", "5", "10", "30", "60"])
+        root.addLayout(self._labeled_row("GPU refresh (seconds)", self._gpu_poll_combo))
 
         root.addStretch()
 
         # --- Footer buttons ---
+        root = outer
+        root.addSpacing(16)
         btn_row = QHBoxLayout()
         btn_row.addStretch()
 
@@ -157,6 +351,47 @@ class AppSettingsDialog(QDialog):
 
         root.addLayout(btn_row)
 
+    def _fit_to_content(self):
+        """Open tall enough to show every section, capped to the screen.
+
+        On short screens (e.g. 1366x768) the sections scroll and the
+        footer buttons stay reachable.
+        """
+        chrome = self.sizeHint().height() - self._scroll.sizeHint().height()
+        height = chrome + self._body.sizeHint().height() + 2 * self._scroll.frameWidth()
+        parent = self.parentWidget()
+        screen = (parent.screen() if parent is not None else None) or QGuiApplication.primaryScreen()
+        if screen is not None:
+            height = min(height, screen.availableGeometry().height() - _SCREEN_MARGIN)
+        self.resize(self.minimumWidth(), height)
+
+    def _load_settings(self):
+        """Read the stored config and fill in the widgets."""
+        self._cfg = load_config()
+        self._original_cfg = copy.deepcopy(self._cfg)   # snapshot for change detection
+
+        self._dark_mode_cb.blockSignals(True)   # don't re-emit theme_changed
+        self._dark_mode_cb.setChecked(self._cfg.get("theme", "dark") == "dark")
+        self._dark_mode_cb.blockSignals(False)
+        self._last_emitted_mode = self._cfg.get("theme", "dark")
+        self._token_input.setText(self._cfg.get("hf_token", ""))
+        self._mmproj_combo.setCurrentText(self._cfg.get("mmproj_quant", "Q8_0"))
+        self._n_batch_combo.setCurrentText(str(self._cfg.get("n_batch", 2048)))
+        self._n_ubatch_combo.setCurrentText(str(self._cfg.get("n_ubatch", 512)))
+        self._flash_attn_cb.setChecked(bool(self._cfg.get("flash_attn", True)))
+        self._tensor_split_input.setText(str(self._cfg.get("tensor_split", "")))
+        self._main_gpu_combo.setCurrentText(str(self._cfg.get("main_gpu", 0)))
+        self._gpu_poll_combo.setCurrentText(str(self._cfg.get("gpu_poll_seconds", 5)))
+
+        # Single model reset — one relayout, first page only
+        paths = list(dict.fromkeys(str(p) for p in self._cfg.get("model_search_paths", [])))
+        self._paths_list.setUpdatesEnabled(False)
+        try:
+            self._paths_model.set_paths(paths)
+        finally:
+            self._paths_list.setUpdatesEnabled(True)
+        self._paths_set = set(paths)
+
     # ------------------------------------------------------------------ #
     # Helpers
     # ------------------------------------------------------------------ #
@@ -164,28 +399,93 @@ class AppSettingsDialog(QDialog):
     @staticmethod
     def _section_header(text: str) -> QLabel:
         lbl = QLabel(text)
-        lbl.setStyleSheet(
-            f"color: {COLORS['text_dim']}; font-size: 10px; font-weight: 700; "
-            f"letter-spacing: 1.5px; background: transparent;"
-        )
+        lbl.setProperty("class", "settings-section")
         return lbl
 
+    @staticmethod
+    def _separator() -> QFrame:
+        sep = QFrame()
+        sep.setProperty("class", "h-separator")
+        return sep
+
+    @staticmethod
+    def _labeled_row(text: str, widget: QWidget) -> QHBoxLayout:
+        row = QHBoxLayout()
+        lbl = QLabel(text)
+        lbl.setProperty("class", "settings-label")
+        row.addWidget(lbl)
+        row.addStretch()
+        row.addWidget(widget)
+        return row
+
     def _toggle_token_visibility(self):
-        if self._token_input.echoMode() == QLineEdit.EchoMode.Password:
+        self._token_visible = not self._token_visible
+        if self._token_visible:
             self._token_input.setEchoMode(QLineEdit.EchoMode.Normal)
             self._show_token_btn.setText("\U0001F576")  # 🕶
         else:
             self._token_input.setEchoMode(QLineEdit.EchoMode.Password)
             self._show_token_btn.setText("\U0001F441")  # 👁
 
+    def _add_search_path(self):
+        folder = QFileDialog.getExistingDirectory(self, "Select Model Folder")
+        if folder and folder not in self._paths_set:
+            self._paths_model.append(folder)
+            self._paths_set.add(folder)
+            self._paths_dirty = True
+
+    def _remove_search_path(self):
+        rows = [idx.row() for idx in self._paths_list.selectionModel().selectedRows()]
+        if not rows:
+            return
+        self._paths_list.setUpdatesEnabled(False)
+        try:
+            removed = self._paths_model.remove_rows(rows)
+        finally:
+            self._paths_list.setUpdatesEnabled(True)
+        self._paths_set.difference_update(removed)
+        self._paths_dirty = True
+
     def _on_theme_toggled(self, state: int):
         """React immediately so the user sees the change in real time."""
         mode = "dark" if self._dark_mode_cb.isChecked() else "light"
         self._cfg["theme"] = mode
-        self.theme_changed.emit(mode)
+        self._theme_timer.start()
+
+    def _emit_theme_if_changed(self):
+        mode = "dark" if self._dark_mode_cb.isChecked() else "light"
+        if mode != self._last_emitted_mode:
+            self._last_emitted_mode = mode
+            self.theme_changed.emit(mode)
+
+    def done(self, result: int):
+        # Deliver a toggle that is still inside the debounce window
+        if self._theme_timer.isActive():
+            self._theme_timer.stop()
+            self._emit_theme_if_changed()
+        super().done(result)
 
     def _save_and_close(self):
         self._cfg["theme"] = "dark" if self._dark_mode_cb.isChecked() else "light"
         self._cfg["hf_token"] = self._token_input.text().strip()
-        save_config(self._cfg)
+        self._cfg["mmproj_quant"] = self._mmproj_combo.currentText()
+        self._cfg["n_batch"] = int(self._n_batch_combo.currentText())
+        self._cfg["n_ubatch"] = int(self._n_ubatch_combo.currentText())
+        self._cfg["flash_attn"] = self._flash_attn_cb.isChecked()
+        split = parse_tensor_split(self._tensor_split_input.text())
+        self._cfg["tensor_split"] = ",".join(f"{p:g}" for p in split) if split else ""
+        self._cfg["main_gpu"] = int(self._main_gpu_combo.currentText())
+        self._cfg["gpu_poll_seconds"] = int(self._gpu_poll_combo.currentText())
+        if self._paths_dirty:
+            self._cfg["model_search_paths"] = self._paths_model.paths()
+        changes = {
+            k: v for k, v in self._cfg.items()
+            if self._original_cfg.get(k) != v
+        }
+        if not changes:
+            self.accept()   # nothing edited — no disk I/O
+            return
+        update_config(changes)
+        if "gpu_poll_seconds" in changes:
+            self.poll_interval_changed.emit(get_gpu_poll_interval_ms())
         self.accept()
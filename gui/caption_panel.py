@@ -19,7 +19,7 @@ from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTextEdit, QFrame, QApplication, QSizePolicy,
+    QPlainTextEdit, QFrame, QApplication, QSizePolicy,
 )
 
 from gui.theme import COLORS
@@ -37,6 +37,7 @@ class CaptionPanel(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setProperty("class", "caption-area")
+        self._clipboard = QApplication.clipboard()
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(16, 12, 16, 12)
@@ -68,31 +69,36 @@ class CaptionPanel(QFrame):
         # Regenerate button (accent blue with glow)
         self.regenerate_btn = QPushButton("\u2728 Regenerate Caption")
         self.regenerate_btn.setProperty("class", "accent-button")
-        self.regenerate_btn.setStyleSheet(
-            f"QPushButton {{ "
-            f"background-color: {COLORS['accent']}; color: #ffffff; border: none; "
-            f"border-radius: 6px; padding: 6px 16px; font-weight: 600; font-size: 12px; "
-            f"}} "
-            f"QPushButton:hover {{ background-color: {COLORS['accent_hover']}; }} "
-            f"QPushButton:disabled {{ background-color: {COLORS['bg_hover']}; color: {COLORS['text_muted']}; }}"
-        )
+        self.regenerate_btn.setObjectName("regenerateButton")
         self.regenerate_btn.clicked.connect(self.regenerate_requested.emit)
         header_row.addWidget(self.regenerate_btn)
 
         layout.addLayout(header_row)
 
         # ── Caption text area (monospace) ──
-        self.caption_text = QTextEdit()
+        self.caption_text = QPlainTextEdit()
         self.caption_text.setPlaceholderText(
             "AI will generate a caption here..."
         )
         self.caption_text.setProperty("class", "caption-editor")
         self.caption_text.setMinimumHeight(80)
         self.caption_text.setMaximumHeight(180)
-        self.caption_text.setAcceptRichText(False)
-        self.caption_text.textChanged.connect(self._update_counts)
+        self.caption_text.textChanged.connect(self._schedule_count_update)
         layout.addWidget(self.caption_text)
 
+        # Coalesce count updates — streaming fires textChanged once per token
+        self._count_timer = QTimer(self)
+        self._count_timer.setSingleShot(True)
+        self._count_timer.setInterval(50)
+        self._count_timer.timeout.connect(self._update_counts)
+
+        # Streamed tokens are buffered and inserted in one edit per tick
+        self._token_buf: list = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(40)
+        self._flush_timer.timeout.connect(self._flush_tokens)
+
         # ── Bottom row: format badge + counts | trash + save ──
         bottom_row = QHBoxLayout()
         bottom_row.setSpacing(16)
@@ -102,9 +108,7 @@ class CaptionPanel(QFrame):
         format_row.setSpacing(6)
 
         format_dot = QLabel("\u25CF")  # filled circle
-        format_dot.setStyleSheet(
-            f"color: {COLORS['accent']}; font-size: 8px;"
-        )
+        format_dot.setProperty("class", "format-dot")
         format_row.addWidget(format_dot)
 
         self.format_badge = QLabel("SDXL FORMAT")
@@ -115,9 +119,7 @@ class CaptionPanel(QFrame):
 
         # Character and word count
         self.count_label = QLabel("0 characters \u2022 0 words")
-        self.count_label.setStyleSheet(
-            f"color: {COLORS['text_dim']}; font-size: 10px;"
-        )
+        self.count_label.setProperty("class", "caption-meta")
         bottom_row.addWidget(self.count_label)
 
         bottom_row.addStretch()
@@ -149,25 +151,26 @@ class CaptionPanel(QFrame):
 
     def set_caption(self, text: str):
         """Set the caption text (replaces current content)."""
+        self._discard_tokens()
         self.caption_text.setPlainText(text)
         self.feedback_label.setText("")
 
     def append_token(self, token: str):
-        """Append a streaming token to the caption."""
-        cursor = self.caption_text.textCursor()
-        cursor.movePosition(cursor.MoveOperation.End)
-        cursor.insertText(token)
-        self.caption_text.setTextCursor(cursor)
-        self.caption_text.ensureCursorVisible()
+        """Append a streaming token to the caption (flushed every 40 ms)."""
+        self._token_buf.append(token)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
 
     def clear_caption(self):
         """Clear the caption text."""
+        self._discard_tokens()
         self.caption_text.clear()
         self.confidence_badge.setVisible(False)
         self.feedback_label.setText("")
 
     def get_caption(self) -> str:
         """Get the current caption text."""
+        self._flush_tokens()
         return self.caption_text.toPlainText().strip()
 
     def set_confidence(self, score: float):
@@ -184,6 +187,8 @@ class CaptionPanel(QFrame):
 
     def set_generating(self, is_generating: bool):
         """Update UI state during generation."""
+        if not is_generating:
+            self._flush_tokens()
         self.regenerate_btn.setEnabled(not is_generating)
         self.regenerate_btn.setText(
             "\u23f3 Generating..." if is_generating else "\u2728 Regenerate Caption"
@@ -195,14 +200,29 @@ class CaptionPanel(QFrame):
 
     # ─── Private ───
 
+    def _flush_tokens(self):
+        """Insert all buffered tokens with a single edit."""
+        self._flush_timer.stop()
+        if not self._token_buf:
+            return
+        text = "".join(self._token_buf)
+        self._token_buf.clear()
+        cursor = self.caption_text.textCursor()
+        cursor.movePosition(cursor.MoveOperation.End)
+        cursor.insertText(text)
+        self.caption_text.setTextCursor(cursor)
+        self.caption_text.ensureCursorVisible()
+
+    def _discard_tokens(self):
+        self._flush_timer.stop()
+        self._token_buf.clear()
+
     def _copy_caption(self):
         """Copy caption text to clipboard with animated feedback."""
         text = self.get_caption()
         if text:
-            clipboard = QApplication.clipboard()
-            clipboard.setText(text)
+            self._clipboard.setText(text)
             # Swap icon to checkmark for 2 seconds
-            original_text = self.copy_btn.text()
             self.copy_btn.setText("\u2714")  # heavy checkmark
             self.copy_btn.setStyleSheet(
                 f"color: {COLORS['success']}; background: transparent; "
@@ -211,18 +231,23 @@ class CaptionPanel(QFrame):
             self.show_feedback("Copied!")
 
             def _restore():
-                self.copy_btn.setText(original_text)
+                self.copy_btn.setText("\U0001F4CB")
                 self.copy_btn.setStyleSheet("")
-                self.copy_btn.setProperty("class", "icon-button")
-                self.copy_btn.style().unpolish(self.copy_btn)
-                self.copy_btn.style().polish(self.copy_btn)
                 self.feedback_label.setText("")
 
             QTimer.singleShot(2000, _restore)
 
+    def _schedule_count_update(self):
+        if not self._count_timer.isActive():
+            self._count_timer.start()
+
     def _update_counts(self):
         """Update character and word counts."""
         text = self.caption_text.toPlainText()
         chars = len(text)
-        words = len(text.split()) if text.strip() else 0
+        if chars > 4096:
+            # Long streamed text — approximate without allocating a word list
+            words = text.count(" ") + text.count("\n") + 1
+        else:
+            words = len(text.split())
         self.count_label.setText(f"{chars} characters \u2022 {words} words")
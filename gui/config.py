@@ -4,9 +4,11 @@ Persistent application configuration for VL-CAPTIONER Studio Pro.
 Stores settings as JSON in ~/.vlcaptioner/config.json.
 """
 
+import copy
 import json
+import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 _CONFIG_DIR = Path.home() / ".vlcaptioner"
 _CONFIG_FILE = _CONFIG_DIR / "config.json"
@@ -14,17 +16,50 @@ _CONFIG_FILE = _CONFIG_DIR / "config.json"
 _DEFAULTS: Dict[str, Any] = {
     "theme": "dark",
     "hf_token": "",
+    "mmproj_quant": "Q8_0",
+    "n_batch": 2048,
+    "n_ubatch": 512,
+    "flash_attn": True,
+    "tensor_split": "",     # e.g. "1,1" — empty = automatic
+    "main_gpu": 0,
+    "model_search_paths": [],   # extra folders scanned for .gguf files
+    "gpu_poll_seconds": 5,      # nav-bar GPU/VRAM refresh period
 }
 
+# Environment override for the GPU poll period (seconds), e.g. for laptops
+_GPU_POLL_ENV = "GPU_POLL_INTERVAL_SECONDS"
+
+# (config file mtime_ns, parsed config) — reused until the file changes
+_cache: Optional[Tuple[Optional[int], Dict[str, Any]]] = None
+
+
+_dir_ready = False
+
 
 def _ensure_dir():
+    global _dir_ready
+    if _dir_ready:
+        return
     _CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    _dir_ready = True
 
 
-def load_config() -> Dict[str, Any]:
-    """Load config from disk, falling back to defaults for missing keys."""
-    cfg = dict(_DEFAULTS)
-    if _CONFIG_FILE.exists():
+def _config_mtime() -> Optional[int]:
+    try:
+        return _CONFIG_FILE.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _cached_config() -> Dict[str, Any]:
+    """Return the shared parsed config (read-only), refreshing it if the file changed."""
+    global _cache
+    mtime = _config_mtime()
+    if _cache is not None and _cache[0] == mtime:
+        return _cache[1]
+
+    cfg = copy.deepcopy(_DEFAULTS)
+    if mtime is not None:
         try:
             with open(_CONFIG_FILE, "r", encoding="utf-8") as f:
                 stored = json.load(f)
@@ -32,24 +67,112 @@ def load_config() -> Dict[str, Any]:
                 cfg.update(stored)
         except Exception:
             pass  # corrupt file — use defaults
+    _cache = (mtime, cfg)
     return cfg
 
 
+def load_config() -> Dict[str, Any]:
+    """Load config from disk, falling back to defaults for missing keys.
+
+    The parsed result is cached and only re-read when the file's mtime
+    changes. Callers get their own copy and may mutate it freely.
+    """
+    return copy.deepcopy(_cached_config())
+
+
 def save_config(cfg: Dict[str, Any]):
-    """Persist the full config dict to disk."""
+    """Persist the full config dict to disk (skipped if nothing changed)."""
+    global _cache
+    if _cache is not None and _cache[0] is not None and _cache[1] == cfg:
+        return
     _ensure_dir()
+    tmp = _CONFIG_FILE.with_suffix(".json.tmp")
     try:
-        with open(_CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump(cfg, f, indent=2)
+        # Serialize up front and swap the file in atomically so a crash
+        # mid-write can never leave a truncated config behind.
+        data = json.dumps(cfg, indent=2).encode("utf-8")
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, _CONFIG_FILE)
+        _cache = (_config_mtime(), copy.deepcopy(cfg))
     except Exception:
-        pass  # best-effort
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        # best-effort
+
+
+def update_config(changes: Dict[str, Any]):
+    """Merge *changes* into the stored config, writing only if a value differs."""
+    current = _cached_config()
+    if all(k in current and current[k] == v for k, v in changes.items()):
+        return
+    cfg = dict(current)
+    cfg.update(changes)
+    save_config(cfg)
 
 
 def get_hf_token() -> str:
     """Convenience: return the stored HuggingFace token (may be empty)."""
-    return load_config().get("hf_token", "")
+    return _cached_config().get("hf_token", "")
 
 
 def get_theme() -> str:
     """Convenience: return the stored theme mode ('dark' or 'light')."""
-    return load_config().get("theme", "dark")
+    return _cached_config().get("theme", "dark")
+
+
+def get_mmproj_quant() -> str:
+    """Convenience: return the preferred vision encoder precision ('Q8_0' or 'F16')."""
+    return _cached_config().get("mmproj_quant", "Q8_0")
+
+
+def get_model_search_paths() -> List[str]:
+    """Convenience: return the user-configured model folders (may be empty)."""
+    paths = _cached_config().get("model_search_paths", [])
+    return [str(p) for p in paths] if isinstance(paths, list) else []
+
+
+def set_model_search_paths(paths: List[str]):
+    """Convenience: persist the user-configured model folders."""
+    update_config({"model_search_paths": [str(p) for p in paths]})
+
+
+def get_gpu_poll_interval_ms() -> int:
+    """Convenience: return the GPU status refresh period in milliseconds.
+
+    GPU_POLL_INTERVAL_SECONDS in the environment takes precedence over the
+    stored setting. Values below one second are clamped up.
+    """
+    value = os.environ.get(_GPU_POLL_ENV) or _cached_config().get("gpu_poll_seconds", 5)
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        seconds = float(_DEFAULTS["gpu_poll_seconds"])
+    return int(max(1.0, seconds) * 1000)
+
+
+def get_load_options() -> Dict[str, Any]:
+    """Convenience: return the advanced keyword arguments for Qwen3VLEngine.load_model()."""
+    cfg = _cached_config()
+    return {
+        "n_batch": int(cfg.get("n_batch", 2048)),
+        "n_ubatch": int(cfg.get("n_ubatch", 512)),
+        "flash_attn": bool(cfg.get("flash_attn", True)),
+        "tensor_split": parse_tensor_split(cfg.get("tensor_split", "")),
+        "main_gpu": int(cfg.get("main_gpu", 0)),
+    }
+
+
+def parse_tensor_split(text: str) -> Optional[List[float]]:
+    """Parse a "1,1"-style GPU split string; None if empty or malformed."""
+    try:
+        parts = [float(p) for p in str(text).replace(" ", "").split(",") if p]
+    except ValueError:
+        return None
+    if len(parts) < 2 or any(p < 0 for p in parts) or sum(parts) <= 0:
+        return None
+    return parts
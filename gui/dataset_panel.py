@@ -6,18 +6,191 @@ Shows a table of imported images with metadata:
 Includes summary stats and a Refresh button.
 """
 
+import json
+import os
+from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QBrush, QImageReader
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QFrame, QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView,
+    QFrame, QTableView, QHeaderView, QAbstractItemView,
 )
 
 from .theme import COLORS
 
+# Persistent {path: [mtime_ns, size_bytes, dims]} so refreshes and restarts
+# don't re-read image headers for unchanged files
+_META_CACHE_FILE = Path.home() / ".vlcaptioner" / "dims.json"
+
+_META_CHUNK = 64          # rows per background metadata task
+_META_IO_THREADS = 16     # metadata tasks are I/O bound — more than CPU count pays off
+_PENDING = "\u2026"       # placeholder shown until a row's metadata arrives
+
+# (mtime_ns, size_bytes, dims) — also the on-disk cache entry format
+_MetaEntry = Tuple[int, int, str]
+
+
+@dataclass
+class DatasetRecord:
+    """One table row — plain data, no Qt objects."""
+    name: str
+    dims: str
+    size_str: str
+    has_caption: bool
+    preview: str
+
+
+class DatasetModel(QAbstractTableModel):
+    """Table model over a list of DatasetRecord; Qt only queries visible cells."""
+
+    HEADERS = ["Filename", "Dimensions", "Size", "Caption", "Preview"]
+
+    _GREEN_BRUSH = QBrush(Qt.GlobalColor.green)
+    _RED_BRUSH = QBrush(Qt.GlobalColor.red)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[DatasetRecord] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole:
+            rec = self._rows[index.row()]
+            col = index.column()
+            if col == 0:
+                return rec.name
+            if col == 1:
+                return rec.dims
+            if col == 2:
+                return rec.size_str
+            if col == 3:
+                return "Yes" if rec.has_caption else "No"
+            return rec.preview
+        if role == Qt.ItemDataRole.ForegroundRole and index.column() == 3:
+            return self._GREEN_BRUSH if self._rows[index.row()].has_caption else self._RED_BRUSH
+        return None
+
+    def set_records(self, records: List[DatasetRecord]):
+        self.beginResetModel()
+        self._rows = records
+        self.endResetModel()
+
+    def update_rows(self, first_row: int, records: List[DatasetRecord]):
+        """Replace a contiguous run of rows and repaint just those."""
+        if not records or first_row + len(records) > len(self._rows):
+            return
+        self._rows[first_row:first_row + len(records)] = records
+        self.dataChanged.emit(
+            self.index(first_row, 0),
+            self.index(first_row + len(records) - 1, len(self.HEADERS) - 1),
+        )
+
+
+class _MetadataSignals(QObject):
+    # generation, first row, [(DatasetRecord, new cache entry or None)]
+    chunk_ready = pyqtSignal(int, int, list)
+
+
+def _sidecar_name(image_name: str) -> str:
+    """``photo.jpg`` -> ``photo.txt`` using string ops only (same as with_suffix)."""
+    return image_name.rsplit(".", 1)[0] + ".txt"
+
+
+class _MetadataTask(QRunnable):
+    """Reads caption preview, size and header dimensions for a run of rows."""
+
+    def __init__(self, signals: _MetadataSignals, generation: int, first_row: int,
+                 items: List[Tuple[Path, Optional[os.DirEntry], Optional[_MetaEntry],
+                                   Optional[Path]]]):
+        super().__init__()
+        self._signals = signals
+        self._generation = generation
+        self._first_row = first_row
+        self._items = items
+
+    def run(self):
+        results = [_read_metadata(*item) for item in self._items]
+        self._signals.chunk_ready.emit(self._generation, self._first_row, results)
+
+
+def _read_metadata(img_path: Path, entry: Optional[os.DirEntry],
+                   cached: Optional[_MetaEntry],
+                   txt_path: Optional[Path]) -> Tuple[DatasetRecord, Optional[_MetaEntry]]:
+    """Build one row's record; safe to call off the GUI thread.
+
+    *txt_path* is the caption sidecar if the directory listing contained
+    one, else None — no existence check is needed here.
+    """
+    has_caption = txt_path is not None
+    preview = ""
+    if has_caption:
+        try:
+            text = txt_path.read_text(encoding="utf-8", errors="replace").strip()
+            preview = text[:120] + ("..." if len(text) > 120 else "")
+        except FileNotFoundError:
+            has_caption = False   # removed since the scan
+        except Exception:
+            preview = "(read error)"
+
+    dims, size_str, fresh = "--", "--", None
+    try:
+        st = entry.stat() if entry is not None else img_path.stat()
+    except OSError:
+        st = None
+    if st is not None:
+        size_str = _format_size(st.st_size)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            dims = cached[2]
+        else:
+            dims = _get_image_dims(img_path)
+            fresh = (st.st_mtime_ns, st.st_size, dims)
+
+    record = DatasetRecord(
+        name=img_path.name, dims=dims, size_str=size_str,
+        has_caption=has_caption, preview=preview,
+    )
+    return record, fresh
+
+
+def _get_image_dims(path: Path) -> str:
+    # QImageReader parses only the header — no pixel decode
+    reader = QImageReader(str(path))
+    size = reader.size()
+    if not size.isValid() and reader.canRead():
+        # Plugin can't report size from the header alone — decode as a last resort
+        size = reader.read().size()
+    if size.isValid():
+        return f"{size.width()} x {size.height()}"
+    return "--"
+
+
+_SIZE_UNITS = ((1 << 30, "GB"), (1 << 20, "MB"), (1 << 10, "KB"))
+
+
+def _format_size(size: int) -> str:
+    for threshold, unit in _SIZE_UNITS:
+        if size >= threshold:
+            return f"{size / threshold:.1f} {unit}"
+    return f"{size} B"
+
 
 class DatasetPanel(QFrame):
     """Dataset verification view: table of images with caption status."""
@@ -26,6 +199,22 @@ class DatasetPanel(QFrame):
         super().__init__(parent)
         self.setStyleSheet(f"background: {COLORS['bg_dark']};")
 
+        self._meta_cache: Dict[str, _MetaEntry] = {}
+        self._meta_cache_loaded = False
+        self._meta_cache_dirty = False
+
+        # Background metadata loading; stale chunks are dropped by generation
+        self._meta_signals = _MetadataSignals(self)
+        self._meta_signals.chunk_ready.connect(self._on_metadata_chunk)
+        self._meta_pool = QThreadPool(self)
+        self._meta_pool.setMaxThreadCount(
+            max(_META_IO_THREADS, QThreadPool.globalInstance().maxThreadCount())
+        )
+        self._generation = 0
+        self._row_paths: List[Path] = []
+        self._total = 0
+        self._captioned = 0
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(16, 16, 16, 16)
         layout.setSpacing(12)
@@ -55,10 +244,10 @@ class DatasetPanel(QFrame):
         stats_layout.setContentsMargins(16, 10, 16, 10)
         stats_layout.setSpacing(24)
 
-        self._stat_total = self._make_stat("Total Images", "0")
-        self._stat_captioned = self._make_stat("Captioned", "0")
-        self._stat_uncaptioned = self._make_stat("Uncaptioned", "0")
-        self._stat_coverage = self._make_stat("Coverage", "0%")
+        self._stat_total, self._stat_total_val = self._make_stat("Total Images", "0")
+        self._stat_captioned, self._stat_captioned_val = self._make_stat("Captioned", "0")
+        self._stat_uncaptioned, self._stat_uncaptioned_val = self._make_stat("Uncaptioned", "0")
+        self._stat_coverage, self._stat_coverage_val = self._make_stat("Coverage", "0%")
 
         stats_layout.addWidget(self._stat_total)
         stats_layout.addWidget(self._stat_captioned)
@@ -68,11 +257,9 @@ class DatasetPanel(QFrame):
         layout.addWidget(self._stats_frame)
 
         # --- Table ---
-        self._table = QTableWidget()
-        self._table.setColumnCount(5)
-        self._table.setHorizontalHeaderLabels([
-            "Filename", "Dimensions", "Size", "Caption", "Preview"
-        ])
+        self._model = DatasetModel(self)
+        self._table = QTableView()
+        self._table.setModel(self._model)
         self._table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self._table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self._table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
@@ -88,7 +275,7 @@ class DatasetPanel(QFrame):
         header.setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)
 
         self._table.setStyleSheet(f"""
-            QTableWidget {{
+            QTableView {{
                 background: {COLORS['bg_darkest']};
                 color: {COLORS['text_primary']};
                 border: 1px solid {COLORS['border']};
@@ -96,10 +283,10 @@ class DatasetPanel(QFrame):
                 gridline-color: {COLORS['border']};
                 font-size: 11px;
             }}
-            QTableWidget::item {{
+            QTableView::item {{
                 padding: 6px 8px;
             }}
-            QTableWidget::item:selected {{
+            QTableView::item:selected {{
                 background: {COLORS['bg_active']};
             }}
             QHeaderView::section {{
@@ -113,7 +300,7 @@ class DatasetPanel(QFrame):
                 border: none;
                 border-bottom: 1px solid {COLORS['border']};
             }}
-            QTableWidget::item:alternate {{
+            QTableView::item:alternate {{
                 background: {COLORS['bg_card']};
             }}
         """)
@@ -134,10 +321,18 @@ class DatasetPanel(QFrame):
         self._refresh_btn.clicked.connect(callback)
 
     def populate(self, image_paths: List[Path]):
-        """Populate the table with image metadata and caption status."""
-        self._table.setRowCount(0)
+        """Populate the table with image metadata and caption status.
+
+        Rows appear immediately with placeholders; dimensions, sizes and
+        caption previews are filled in by background tasks in chunks.
+        """
+        self._generation += 1
+        self._total = len(image_paths)
+        self._captioned = 0
 
         if not image_paths:
+            self._row_paths = []
+            self._model.set_records([])
             self._table.setVisible(False)
             self._empty_label.setVisible(True)
             self._update_stats(0, 0)
@@ -145,58 +340,72 @@ class DatasetPanel(QFrame):
 
         self._table.setVisible(True)
         self._empty_label.setVisible(False)
-        self._table.setRowCount(len(image_paths))
-
-        captioned = 0
-        for row, img_path in enumerate(sorted(image_paths, key=lambda p: p.name.lower())):
-            # Filename
-            self._table.setItem(row, 0, QTableWidgetItem(img_path.name))
-
-            # Dimensions
-            dims = self._get_image_dims(img_path)
-            self._table.setItem(row, 1, QTableWidgetItem(dims))
-
-            # File size
-            size_str = self._format_size(img_path)
-            self._table.setItem(row, 2, QTableWidgetItem(size_str))
-
-            # Caption file exists?
-            txt_path = img_path.with_suffix(".txt")
-            has_caption = txt_path.exists()
-            if has_caption:
-                captioned += 1
-            status_item = QTableWidgetItem("Yes" if has_caption else "No")
-            status_item.setForeground(
-                QPixmap(1, 1).toImage().pixelColor(0, 0)  # placeholder — set via stylesheet
-            )
-            if has_caption:
-                status_item.setForeground(Qt.GlobalColor.green)
-            else:
-                status_item.setForeground(Qt.GlobalColor.red)
-            self._table.setItem(row, 3, status_item)
-
-            # Caption preview
-            preview = ""
-            if has_caption:
-                try:
-                    text = txt_path.read_text(encoding="utf-8", errors="replace").strip()
-                    preview = text[:120] + ("..." if len(text) > 120 else "")
-                except Exception:
-                    preview = "(read error)"
-            self._table.setItem(row, 4, QTableWidgetItem(preview))
-
-        self._update_stats(len(image_paths), captioned)
+
+        if not self._meta_cache_loaded:
+            self._load_meta_cache()
+
+        # One directory scan per parent; DirEntry caches its stat() result and
+        # the listing doubles as the set of existing caption sidecars
+        entries: Dict[Path, Dict[str, os.DirEntry]] = {}
+        sidecars: Dict[Path, Dict[str, str]] = {}   # normcase(name) -> name
+        for parent in {p.parent for p in image_paths}:
+            try:
+                with os.scandir(parent) as it:
+                    entries[parent] = {e.name: e for e in it}
+            except OSError:
+                entries[parent] = {}
+            sidecars[parent] = {
+                os.path.normcase(name): name
+                for name in entries[parent] if name.lower().endswith(".txt")
+            }
+
+        def _sidecar_path(p: Path) -> Optional[Path]:
+            name = sidecars[p.parent].get(os.path.normcase(_sidecar_name(p.name)))
+            return p.parent / name if name is not None else None
+
+        # Decorate once, then sort on a C-level key
+        pairs = [(p.name.lower(), p) for p in image_paths]
+        pairs.sort(key=itemgetter(0))
+        self._row_paths = [p for _, p in pairs]
+        self._model.set_records([
+            DatasetRecord(p.name, _PENDING, _PENDING, False, "")
+            for p in self._row_paths
+        ])
+        self._update_stats(self._total, 0)
+
+        pool = self._meta_pool
+        for first in range(0, len(self._row_paths), _META_CHUNK):
+            items = [
+                (p, entries[p.parent].get(p.name), self._meta_cache.get(str(p)),
+                 _sidecar_path(p))
+                for p in self._row_paths[first:first + _META_CHUNK]
+            ]
+            pool.start(_MetadataTask(self._meta_signals, self._generation, first, items))
+
+    def _on_metadata_chunk(self, generation: int, first_row: int, results: list):
+        if generation != self._generation:
+            return  # a newer populate() superseded this chunk
+        records = []
+        for offset, (record, fresh) in enumerate(results):
+            records.append(record)
+            if record.has_caption:
+                self._captioned += 1
+            if fresh is not None:
+                self._meta_cache[str(self._row_paths[first_row + offset])] = fresh
+                self._meta_cache_dirty = True
+        self._model.update_rows(first_row, records)
+        self._update_stats(self._total, self._captioned)
 
     def _update_stats(self, total: int, captioned: int):
         uncaptioned = total - captioned
         pct = int(captioned / total * 100) if total > 0 else 0
 
-        self._stat_total.findChild(QLabel, "stat_value").setText(str(total))
-        self._stat_captioned.findChild(QLabel, "stat_value").setText(str(captioned))
-        self._stat_uncaptioned.findChild(QLabel, "stat_value").setText(str(uncaptioned))
-        self._stat_coverage.findChild(QLabel, "stat_value").setText(f"{pct}%")
+        self._stat_total_val.setText(str(total))
+        self._stat_captioned_val.setText(str(captioned))
+        self._stat_uncaptioned_val.setText(str(uncaptioned))
+        self._stat_coverage_val.setText(f"{pct}%")
 
-    def _make_stat(self, label: str, value: str) -> QWidget:
+    def _make_stat(self, label: str, value: str) -> Tuple[QWidget, QLabel]:
         w = QWidget()
         w.setStyleSheet("background: transparent;")
         vl = QVBoxLayout(w)
@@ -217,27 +426,30 @@ class DatasetPanel(QFrame):
             f"font-family: 'Consolas', monospace;"
         )
         vl.addWidget(val)
-        return w
+        return w, val
 
-    @staticmethod
-    def _get_image_dims(path: Path) -> str:
+    # ─── Metadata cache ───
+
+    def _load_meta_cache(self):
+        self._meta_cache_loaded = True
         try:
-            px = QPixmap(str(path))
-            if not px.isNull():
-                return f"{px.width()} x {px.height()}"
+            with open(_META_CACHE_FILE, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            if isinstance(stored, dict):
+                self._meta_cache = {
+                    k: (int(v[0]), int(v[1]), str(v[2])) for k, v in stored.items()
+                }
         except Exception:
-            pass
-        return "--"
+            pass  # missing or corrupt — start empty
 
-    @staticmethod
-    def _format_size(path: Path) -> str:
+    def save_meta_cache(self):
+        """Persist the dimensions cache (called on application shutdown)."""
+        if not self._meta_cache_dirty:
+            return
         try:
-            size = path.stat().st_size
-            if size < 1024:
-                return f"{size} B"
-            elif size < 1024 * 1024:
-                return f"{size / 1024:.1f} KB"
-            else:
-                return f"{size / (1024 * 1024):.1f} MB"
+            _META_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(_META_CACHE_FILE, "w", encoding="utf-8") as f:
+                json.dump(self._meta_cache, f)
+            self._meta_cache_dirty = False
         except Exception:
-            return "--"
+            pass  # best-effort
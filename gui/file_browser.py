@@ -10,175 +10,501 @@ snippets. Matches the Figma "VL-CAPTIONER Studio Pro" sidebar design:
   - Status text: blue for processing, zinc-500 for pending
   - Import button at bottom
   - Drag & Drop support for images and folders
+
+The list is a virtualized QListView: rows are plain column lists in a model and
+are painted by a delegate, so only visible rows cost anything. Thumbnails
+are decoded on the thread pool the first time a row is painted.
 """
 
+import hashlib
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from PyQt6.QtCore import Qt, pyqtSignal, QSize, QTimer, QMimeData
-from PyQt6.QtGui import QPixmap, QIcon, QFont, QPainter, QColor, QPen, QBrush, QDragEnterEvent, QDropEvent
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QSize, QTimer, QMimeData, QRect, QObject, QRunnable,
+    QThreadPool, QAbstractListModel, QModelIndex, QByteArray,
+)
+from PyQt6.QtGui import (
+    QPixmap, QImage, QIcon, QFont, QPainter, QColor, QPen, QBrush,
+    QImageReader, QDragEnterEvent, QDropEvent,
+)
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QLineEdit, QScrollArea, QFrame, QFileDialog, QSizePolicy,
+    QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QLineEdit, QFrame, QFileDialog, QListView,
+    QStyledItemDelegate, QStyle, QAbstractItemView,
 )
+from PyQt6.QtSvg import QSvgRenderer
 
-from engine.inference import IMAGE_EXTENSIONS
+from engine.image_formats import IMAGE_EXTENSIONS
 from gui.theme import COLORS
 
 
 THUMB_SIZE = 48
+ROW_HEIGHT = 64
 
+_EXTENSIONS_NO_DOT = frozenset(ext[1:] for ext in IMAGE_EXTENSIONS)
+_CAPTION_READ_WORKERS = 16   # small reads overlap well, esp. on network shares
 
-class _CheckCircleOverlay(QWidget):
-    """Small emerald check-circle painted in the top-right corner of a thumbnail."""
+# Finished thumbnails persist across sessions, keyed by path + mtime + size
+_THUMB_CACHE_DIR = Path.home() / ".vlcaptioner" / "thumbs"
+_THUMB_CACHE_LIMIT = 500 * 1024 * 1024   # pruned least-recently-used first on startup
 
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setFixedSize(16, 16)
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
+def _decode_thumbnail(path: Path) -> QImage:
+    """Decode *path* to a THUMB_SIZE image (null image on failure).
+
+    The reader decodes straight to roughly thumbnail size (libjpeg scales
+    during the IDCT), so full-resolution pixels are never materialised.
+    """
+    reader = QImageReader(str(path))
+    reader.setAutoTransform(True)
+    orig = reader.size()
+    if orig.isValid():
+        target = QSize(THUMB_SIZE * 2, THUMB_SIZE * 2)
+        if orig.width() > target.width() or orig.height() > target.height():
+            reader.setScaledSize(orig.scaled(target, Qt.AspectRatioMode.KeepAspectRatio))
+    image = reader.read()
+    if image.isNull():
+        return image
+    return image.scaled(
+        THUMB_SIZE, THUMB_SIZE,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation,
+    )
+
+
+def _thumbnail_image(path: Path) -> QImage:
+    """Return the thumbnail for *path* from the disk cache or a fresh decode.
+
+    Uses QImage only, so it is safe to run on a worker thread.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return QImage()
+    key = hashlib.md5(f"{path}:{st.st_mtime_ns}:{st.st_size}".encode("utf-8")).hexdigest()
+
+    cached_file = _THUMB_CACHE_DIR / f"{key}.png"
+    image = QImage(str(cached_file))   # null on a miss — no separate exists() probe
+    if image.isNull():
+        image = _decode_thumbnail(path)
+        if image.isNull():
+            return image
+        try:
+            _THUMB_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            image.save(str(cached_file), "PNG")
+        except OSError:
+            pass  # cache is best-effort
+    return image
+
+
+def _prune_thumbnail_cache(limit_bytes: int = _THUMB_CACHE_LIMIT):
+    """Delete least recently used cached thumbnails until the cache fits *limit_bytes*.
+
+    Recency is the later of a file's atime and mtime, so cache hits need no
+    extra write to be tracked.
+    """
+    entries = []
+    total = 0
+    try:
+        with os.scandir(_THUMB_CACHE_DIR) as it:
+            for entry in it:
+                if not entry.name.endswith(".png"):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                entries.append((max(st.st_atime_ns, st.st_mtime_ns), st.st_size, entry.path))
+                total += st.st_size
+    except OSError:
+        return  # no cache yet
+    if total <= limit_bytes:
+        return
+    entries.sort()
+    for _, size, file_path in entries:
+        try:
+            os.remove(file_path)
+        except OSError:
+            continue
+        total -= size
+        if total <= limit_bytes:
+            break
+
+
+def _scan_image_dir(dir_path: Path, sort: bool = True) -> List[Path]:
+    """Image files directly inside *dir_path*, sorted case-insensitively by name
+    unless *sort* is False.
+
+    DirEntry.is_file() uses the type from the directory listing, so regular
+    files need no extra stat() call.
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            entries = [
+                e for e in it
+                if e.name.rpartition(".")[2].lower() in _EXTENSIONS_NO_DOT and e.is_file()
+            ]
+    except OSError:
+        return []
+    if not sort:
+        return [Path(e.path) for e in entries]
+    pairs = [(e.name.lower(), e) for e in entries]
+    pairs.sort(key=itemgetter(0))
+    return [Path(e.path) for _, e in pairs]
+
+
+def _read_caption_safe(txt_path: Optional[Path]) -> Optional[str]:
+    """Caption text of a sidecar, or None if absent/unreadable."""
+    if txt_path is None:
+        return None
+    try:
+        return txt_path.read_text(encoding="utf-8").strip()
+    except Exception:
+        return None
+
+
+def _to_qcolor(value: str) -> QColor:
+    """QColor from a palette entry, including the CSS ``rgba(r, g, b, a)`` form."""
+    if value.startswith("rgba("):
+        r, g, b, a = (p.strip() for p in value[5:-1].split(","))
+        return QColor(int(r), int(g), int(b), int(float(a) * 255))
+    return QColor(value)
+
+
+_ICON_DIR = Path(__file__).parent / "icons"
+_ICON_CACHE: Dict[Tuple[str, str], QIcon] = {}
+
+# Pre-rendered check badge, keyed by colour (only the palette could change it)
+_CHECK_PIXMAP: Optional[QPixmap] = None
+_CHECK_PIXMAP_COLOR = ""
+
+
+def _get_check_pixmap() -> QPixmap:
+    """Small emerald check-circle, 16×16, rasterised once per process."""
+    global _CHECK_PIXMAP, _CHECK_PIXMAP_COLOR
+    color = COLORS["success"]
+    if _CHECK_PIXMAP is None or _CHECK_PIXMAP_COLOR != color:
+        pixmap = QPixmap(32, 32)            # 2x for crisp HiDPI rendering
+        pixmap.setDevicePixelRatio(2.0)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         # Filled circle
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(COLORS["success"]))
+        painter.setBrush(QColor(color))
         painter.drawEllipse(1, 1, 13, 13)
         # White checkmark
         painter.setPen(QPen(QColor("#ffffff"), 1.8))
         painter.drawLine(4, 7, 6, 10)
         painter.drawLine(6, 10, 11, 4)
         painter.end()
+        _CHECK_PIXMAP, _CHECK_PIXMAP_COLOR = pixmap, color
+    return _CHECK_PIXMAP
 
 
-class ThumbnailItem(QFrame):
-    """A single thumbnail entry in the file list."""
+def _svg_icon(name: str, color: str) -> QIcon:
+    """Icon from gui/icons/<name>.svg stroked in *color*, rasterised once.
 
-    clicked = pyqtSignal(Path)
+    Replaces emoji glyphs, which go through the colour-emoji font on every
+    repaint; a QIcon pixmap is a plain blit.
+    """
+    key = (name, color)
+    icon = _ICON_CACHE.get(key)
+    if icon is None:
+        icon = QIcon()
+        try:
+            data = (_ICON_DIR / f"{name}.svg").read_bytes()
+        except OSError:
+            data = b""
+        renderer = QSvgRenderer(QByteArray(data.replace(b"currentColor", color.encode())))
+        if renderer.isValid():
+            for size in (16, 32):               # 1x and 2x (HiDPI)
+                pixmap = QPixmap(size, size)
+                pixmap.fill(Qt.GlobalColor.transparent)
+                painter = QPainter(pixmap)
+                renderer.render(painter)
+                painter.end()
+                icon.addPixmap(pixmap)
+        _ICON_CACHE[key] = icon
+    return icon
+
+
+class _FileStore:
+    """The file list as parallel per-field lists, indexed by row.
+
+    Bulk passes (search filtering, path listing) walk one flat list instead
+    of touching every row object.
+    """
 
-    def __init__(self, image_path: Path, parent=None):
-        super().__init__(parent)
-        self.image_path = image_path
-        self._is_selected = False
-        self._caption_preview = ""
-        self._status = "idle"  # idle, queued, processing, done
-
-        self.setProperty("class", "thumbnail-item")
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.setFixedHeight(64)
-
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(8, 4, 8, 4)
-        layout.setSpacing(10)
-
-        # Thumbnail image container (relative positioning for overlay)
-        thumb_container = QWidget()
-        thumb_container.setFixedSize(THUMB_SIZE, THUMB_SIZE)
-        thumb_container.setStyleSheet("background: transparent;")
-
-        self.thumb_label = QLabel(thumb_container)
-        self.thumb_label.setFixedSize(THUMB_SIZE, THUMB_SIZE)
-        self.thumb_label.setStyleSheet(
-            f"border-radius: 4px; background: {COLORS['bg_hover']}; "
-            f"border: 1px solid {COLORS['border_light']};"
-        )
-        self.thumb_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self._load_thumbnail()
+    __slots__ = ("paths", "names", "names_lower", "statuses", "captions",
+                 "thumbs", "thumb_requested")
 
-        # Check overlay (hidden by default)
-        self._check_overlay = _CheckCircleOverlay(thumb_container)
-        self._check_overlay.move(THUMB_SIZE - 14, -2)
-        self._check_overlay.setVisible(False)
+    def __init__(self):
+        self.clear()
 
-        layout.addWidget(thumb_container)
+    def clear(self):
+        self.paths: List[Path] = []
+        self.names: List[str] = []
+        self.names_lower: List[str] = []      # precomputed search keys
+        self.statuses: List[str] = []         # idle, queued, processing, done
+        self.captions: List[str] = []
+        self.thumbs: List[Optional[QPixmap]] = []   # None = not loaded, null = failed
+        self.thumb_requested: List[bool] = []
 
-        # Text info
-        text_layout = QVBoxLayout()
-        text_layout.setContentsMargins(0, 2, 0, 2)
-        text_layout.setSpacing(3)
+    def __len__(self) -> int:
+        return len(self.paths)
 
-        self.name_label = QLabel(image_path.name)
-        self.name_label.setStyleSheet(
-            f"font-weight: 500; font-size: 12px; color: {COLORS['text_primary']};"
-        )
-        self.name_label.setWordWrap(False)
-        text_layout.addWidget(self.name_label)
+    def extend(self, paths: List[Path], captions: List[Optional[str]]):
+        """Append rows; a row with a caption starts out as "done"."""
+        n = len(paths)
+        names = [p.name for p in paths]
+        self.paths.extend(paths)
+        self.names.extend(names)
+        self.names_lower.extend(name.lower() for name in names)
+        self.statuses.extend("idle" if c is None else "done" for c in captions)
+        self.captions.extend(c or "" for c in captions)
+        self.thumbs.extend([None] * n)
+        self.thumb_requested.extend([False] * n)
 
-        self.preview_label = QLabel("")
-        self.preview_label.setStyleSheet(
-            f"font-size: 10px; color: {COLORS['text_dim']};"
-        )
-        self.preview_label.setWordWrap(False)
-        text_layout.addWidget(self.preview_label)
-
-        layout.addLayout(text_layout, 1)
-
-    def _load_thumbnail(self):
-        """Load and scale the thumbnail image."""
-        pixmap = QPixmap(str(self.image_path))
-        if not pixmap.isNull():
-            scaled = pixmap.scaled(
-                THUMB_SIZE, THUMB_SIZE,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-            self.thumb_label.setPixmap(scaled)
-        else:
-            self.thumb_label.setText("?")
-
-    def set_selected(self, selected: bool):
-        """Update visual selection state."""
-        self._is_selected = selected
-        self.setProperty("class", "thumbnail-selected" if selected else "thumbnail-item")
-        self.style().unpolish(self)
-        self.style().polish(self)
-
-    def set_caption_preview(self, text: str):
-        """Show a preview snippet of the caption."""
-        self._caption_preview = text
-        preview = text[:40] + "..." if len(text) > 40 else text
-        self.preview_label.setText(preview)
-        self.preview_label.setStyleSheet(
-            f"font-size: 10px; color: {COLORS['text_dim']};"
-        )
 
-    def set_status(self, status: str):
-        """Set the status badge (idle, queued, processing, done)."""
-        self._status = status
+class _ThumbnailSignals(QObject):
+    ready = pyqtSignal(str, QImage)   # str(path), thumbnail (null on failure)
 
-        # Show/hide check overlay
-        self._check_overlay.setVisible(status == "done")
 
-        if status == "idle" and self._caption_preview:
-            self.preview_label.setText(
-                self._caption_preview[:40] + ("..." if len(self._caption_preview) > 40 else "")
-            )
-            self.preview_label.setStyleSheet(
-                f"font-size: 10px; color: {COLORS['text_dim']};"
-            )
-        elif status == "queued":
-            self.preview_label.setText("Queued")
-            self.preview_label.setStyleSheet(
-                f"font-size: 10px; color: {COLORS['text_dim']};"
-            )
-        elif status == "processing":
-            self.preview_label.setText("Captioning...")
-            self.preview_label.setStyleSheet(
-                f"font-size: 10px; color: {COLORS['accent_text']};"
-            )
-        elif status == "done":
-            if self._caption_preview:
-                self.preview_label.setText(
-                    self._caption_preview[:40]
-                    + ("..." if len(self._caption_preview) > 40 else "")
-                )
-                self.preview_label.setStyleSheet(
-                    f"font-size: 10px; color: {COLORS['text_dim']};"
+class _ThumbnailTask(QRunnable):
+    """Loads one thumbnail off the GUI thread."""
+
+    def __init__(self, path: Path, signals: _ThumbnailSignals):
+        super().__init__()
+        self._path = path
+        self._signals = signals
+
+    def run(self):
+        self._signals.ready.emit(str(self._path), _thumbnail_image(self._path))
+
+
+class _ThumbnailCachePruneTask(QRunnable):
+    """Trims the on-disk thumbnail cache off the GUI thread."""
+
+    def run(self):
+        _prune_thumbnail_cache()
+
+
+class FileListModel(QAbstractListModel):
+    """List model over a _FileStore; thumbnails load lazily on first paint."""
+
+    PathRole = Qt.ItemDataRole.UserRole
+    StatusRole = Qt.ItemDataRole.UserRole + 1
+    PreviewRole = Qt.ItemDataRole.UserRole + 2
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._store = _FileStore()
+        self._rows: Dict[str, int] = {}   # str(path) -> row
+        self._signals = _ThumbnailSignals(self)
+        self._signals.ready.connect(self._on_thumbnail_ready)
+
+    # ─── Qt model API ───
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._store)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        store = self._store
+        if role == Qt.ItemDataRole.DisplayRole:
+            return store.names[row]
+        if role == Qt.ItemDataRole.DecorationRole:
+            if store.thumbs[row] is None and not store.thumb_requested[row]:
+                store.thumb_requested[row] = True
+                QThreadPool.globalInstance().start(
+                    _ThumbnailTask(store.paths[row], self._signals)
                 )
+            return store.thumbs[row]
+        if role == self.PathRole:
+            return store.paths[row]
+        if role == self.StatusRole:
+            return store.statuses[row]
+        if role == self.PreviewRole:
+            return store.captions[row]
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return str(store.paths[row])
+        return None
+
+    # ─── Mutation helpers ───
+
+    def new_paths(self, paths: List[Path]) -> List[Path]:
+        """Return the paths not already listed (deduplicated, order kept)."""
+        new_paths = []
+        seen = set()
+        for p in paths:
+            key = str(p)
+            if key not in self._rows and key not in seen:
+                seen.add(key)
+                new_paths.append(p)
+        return new_paths
 
-    def mousePressEvent(self, event):
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.clicked.emit(self.image_path)
-        super().mousePressEvent(event)
+    def append_files(self, paths: List[Path], captions: List[Optional[str]]):
+        """Append rows (caption None = no sidecar) with a single row insertion."""
+        if not paths:
+            return
+        first = len(self._store)
+        self.beginInsertRows(QModelIndex(), first, first + len(paths) - 1)
+        self._rows.update((str(p), first + offset) for offset, p in enumerate(paths))
+        self._store.extend(paths, captions)
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._store.clear()
+        self._rows.clear()
+        self.endResetModel()
+
+    def paths(self) -> List[Path]:
+        return list(self._store.paths)
+
+    def names_lower(self) -> List[str]:
+        """Lowercased file names in row order (the search index; do not mutate)."""
+        return self._store.names_lower
+
+    def row_of(self, path: Path) -> int:
+        return self._rows.get(str(path), -1)
+
+    def set_status(self, path: Path, status: str):
+        row = self.row_of(path)
+        if row >= 0 and self._store.statuses[row] != status:
+            self._store.statuses[row] = status
+            self._emit_row_changed(row)
+
+    def set_caption_preview(self, path: Path, text: str):
+        row = self.row_of(path)
+        if row >= 0:
+            self._store.captions[row] = text
+            self._emit_row_changed(row)
+
+    def _emit_row_changed(self, row: int):
+        idx = self.index(row, 0)
+        self.dataChanged.emit(idx, idx)
+
+    def _on_thumbnail_ready(self, key: str, image: QImage):
+        row = self._rows.get(key, -1)
+        if row < 0:
+            return   # list was cleared meanwhile
+        self._store.thumbs[row] = QPixmap() if image.isNull() else QPixmap.fromImage(image)
+        self._emit_row_changed(row)
+
+
+class _ThumbnailDelegate(QStyledItemDelegate):
+    """Paints a file row: thumbnail, check badge, file name and status line."""
+
+    _COLOR_KEYS = ("accent_dim", "accent", "bg_dark", "border_light", "bg_hover",
+                   "text_dim", "text_primary", "accent_text")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Colours, pen and fonts are built once and rebuilt only when the
+        # palette (theme switch) or the view font changes
+        self._palette_key: Optional[tuple] = None
+        self._colors: Dict[str, QColor] = {}
+        self._box_pen = QPen()
+        self._font_key = ""
+        self._name_font = QFont()
+        self._small_font = QFont()
+
+    def _refresh_style(self, base_font: QFont):
+        palette_key = tuple(COLORS[k] for k in self._COLOR_KEYS)
+        if palette_key != self._palette_key:
+            self._colors = {k: _to_qcolor(v) for k, v in zip(self._COLOR_KEYS, palette_key)}
+            self._box_pen = QPen(self._colors["border_light"], 1)
+            self._palette_key = palette_key
+        font_key = base_font.key()
+        if font_key != self._font_key:
+            self._name_font = QFont(base_font)
+            self._name_font.setPixelSize(12)
+            self._name_font.setWeight(QFont.Weight.Medium)
+            self._small_font = QFont(base_font)
+            self._small_font.setPixelSize(10)
+            self._font_key = font_key
+
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(option.rect.width(), ROW_HEIGHT)
+
+    def paint(self, painter: QPainter, option, index: QModelIndex):
+        self._refresh_style(option.font)
+        colors = self._colors
+        painter.save()
+        rect = option.rect
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+
+        # Row background, blue left border when selected
+        if selected:
+            painter.fillRect(rect, colors["accent_dim"])
+            painter.fillRect(QRect(rect.left(), rect.top(), 2, rect.height()),
+                             colors["accent"])
+        elif hovered:
+            painter.fillRect(rect, colors["bg_dark"])
+
+        # Thumbnail box
+        box = QRect(rect.left() + 12, rect.top() + (rect.height() - THUMB_SIZE) // 2,
+                    THUMB_SIZE, THUMB_SIZE)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(self._box_pen)
+        painter.setBrush(colors["bg_hover"])
+        painter.drawRoundedRect(box.adjusted(0, 0, -1, -1), 4, 4)
+
+        thumb = index.data(Qt.ItemDataRole.DecorationRole)
+        if thumb is not None and not thumb.isNull():
+            x = box.left() + (THUMB_SIZE - thumb.width()) // 2
+            y = box.top() + (THUMB_SIZE - thumb.height()) // 2
+            painter.drawPixmap(x, y, thumb)
+        elif thumb is not None:
+            painter.setPen(colors["text_dim"])
+            painter.drawText(box, Qt.AlignmentFlag.AlignCenter, "?")
+
+        status = index.data(FileListModel.StatusRole)
+        if status == "done":
+            painter.drawPixmap(box.right() - 13, box.top() - 2, _get_check_pixmap())
+
+        # Text column
+        text_left = box.right() + 11
+        text_width = max(0, rect.right() - 8 - text_left)
+
+        painter.setFont(self._name_font)
+        painter.setPen(colors["text_primary"])
+        name = painter.fontMetrics().elidedText(
+            index.data(Qt.ItemDataRole.DisplayRole), Qt.TextElideMode.ElideRight, text_width
+        )
+        painter.drawText(QRect(text_left, rect.top() + 14, text_width, 18),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, name)
+
+        line, color = self._status_line(status, index.data(FileListModel.PreviewRole))
+        if line:
+            painter.setFont(self._small_font)
+            painter.setPen(colors[color])
+            line = painter.fontMetrics().elidedText(line, Qt.TextElideMode.ElideRight, text_width)
+            painter.drawText(QRect(text_left, rect.top() + 34, text_width, 16),
+                             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, line)
+
+        painter.restore()
+
+    @staticmethod
+    def _status_line(status: str, preview: str):
+        """Second line text + colour key for a row (mirrors the old status badge)."""
+        if status == "queued":
+            return "Queued", "text_dim"
+        if status == "processing":
+            return "Captioning...", "accent_text"
+        if preview:
+            return preview[:40] + ("..." if len(preview) > 40 else ""), "text_dim"
+        return "", "text_dim"
 
 
 class _DropOverlay(QFrame):
@@ -192,16 +518,24 @@ class _DropOverlay(QFrame):
             f"border-radius: 8px;"
         )
         self.setVisible(False)
-        self._label = QLabel("📂  Drop images here", self)
+        layout = QVBoxLayout(self)
+        layout.setSpacing(8)
+        layout.addStretch()
+
+        icon = QLabel()
+        icon.setPixmap(_svg_icon("folder-open", COLORS["accent_text"]).pixmap(32, 32))
+        icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        icon.setStyleSheet("background: transparent; border: none;")
+        layout.addWidget(icon)
+
+        self._label = QLabel("Drop images here")
         self._label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self._label.setStyleSheet(
             f"color: {COLORS['accent_text']}; font-size: 14px; font-weight: 600; "
             f"background: transparent; border: none;"
         )
-
-    def resizeEvent(self, event):
-        self._label.setGeometry(0, 0, self.width(), self.height())
-        super().resizeEvent(event)
+        layout.addWidget(self._label)
+        layout.addStretch()
 
 
 class FileBrowserPanel(QFrame):
@@ -224,8 +558,10 @@ class FileBrowserPanel(QFrame):
         # Enable drag & drop
         self.setAcceptDrops(True)
 
-        self._items: Dict[str, ThumbnailItem] = {}  # str(path) -> ThumbnailItem
+        self._model = FileListModel(self)
         self._current_selection: Optional[Path] = None
+        self._selecting = False   # set while select_item moves the current row
+        QThreadPool.globalInstance().start(_ThumbnailCachePruneTask())
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -245,10 +581,8 @@ class FileBrowserPanel(QFrame):
         title_row.setSpacing(8)
 
         # Folder icon (blue)
-        folder_icon = QLabel("\U0001F4C2")  # open folder emoji
-        folder_icon.setStyleSheet(
-            f"font-size: 16px; color: {COLORS['accent_text']};"
-        )
+        folder_icon = QLabel()
+        folder_icon.setPixmap(_svg_icon("folder-open", COLORS["accent_text"]).pixmap(16, 16))
         title_row.addWidget(folder_icon)
 
         title_label = QLabel("Project Files")
@@ -273,25 +607,34 @@ class FileBrowserPanel(QFrame):
         # Search input
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search images...")
-        self.search_input.textChanged.connect(self._filter_items)
+        self.search_input.textChanged.connect(self._schedule_filter)
+
+        # Typing "cat" filters once, not three times
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(
+            lambda: self._filter_items(self.search_input.text())
+        )
         header_layout.addWidget(self.search_input)
 
         layout.addWidget(header)
 
         # ── Scrollable thumbnail list ──
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-
-        self._list_widget = QWidget()
-        self._list_widget.setStyleSheet(f"background: {COLORS['bg_darkest']};")
-        self._list_layout = QVBoxLayout(self._list_widget)
-        self._list_layout.setContentsMargins(0, 4, 0, 4)
-        self._list_layout.setSpacing(0)
-        self._list_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-
-        scroll.setWidget(self._list_widget)
-        layout.addWidget(scroll, 1)
+        self._list_view = QListView()
+        self._list_view.setModel(self._model)
+        self._list_view.setItemDelegate(_ThumbnailDelegate(self._list_view))
+        self._list_view.setUniformItemSizes(True)
+        self._list_view.setMouseTracking(True)   # hover highlight
+        self._list_view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self._list_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._list_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self._list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self._list_view.setCursor(Qt.CursorShape.PointingHandCursor)
+        self._list_view.setObjectName("fileList")
+        # Mouse clicks and keyboard navigation both move the current row
+        self._list_view.selectionModel().currentChanged.connect(self._on_current_changed)
+        layout.addWidget(self._list_view, 1)
 
         # ── Action buttons ──
         btn_frame = QFrame()
@@ -304,7 +647,9 @@ class FileBrowserPanel(QFrame):
         btn_layout.setSpacing(6)
 
         # Import Folder (primary action)
-        self.import_folder_btn = QPushButton("📂  Open Folder")
+        self.import_folder_btn = QPushButton(" Open Folder")
+        self.import_folder_btn.setIcon(_svg_icon("folder-open", "#ffffff"))
+        self.import_folder_btn.setIconSize(QSize(14, 14))
         self.import_folder_btn.setProperty("class", "accent-button")
         self.import_folder_btn.setFixedHeight(32)
         self.import_folder_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -316,7 +661,9 @@ class FileBrowserPanel(QFrame):
         add_row = QHBoxLayout()
         add_row.setSpacing(6)
 
-        self.import_btn = QPushButton("📄 Add Files")
+        self.import_btn = QPushButton(" Add Files")
+        self.import_btn.setIcon(_svg_icon("file-plus", COLORS["text_secondary"]))
+        self.import_btn.setIconSize(QSize(14, 14))
         self.import_btn.setProperty("class", "secondary-button")
         self.import_btn.setFixedHeight(28)
         self.import_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -342,12 +689,20 @@ class FileBrowserPanel(QFrame):
         btn_layout.addLayout(add_row)
 
         # Drag & drop hint label
-        drop_hint = QLabel("💡 Tip: drag & drop images or folders here")
+        hint_row = QHBoxLayout()
+        hint_row.setSpacing(4)
+        hint_row.addStretch()
+        hint_icon = QLabel()
+        hint_icon.setPixmap(_svg_icon("lightbulb", COLORS["warning"]).pixmap(12, 12))
+        hint_icon.setStyleSheet("padding-top: 2px;")
+        hint_row.addWidget(hint_icon)
+        drop_hint = QLabel("Tip: drag & drop images or folders here")
         drop_hint.setStyleSheet(
             f"color: {COLORS['text_dim']}; font-size: 9px; font-style: italic; padding-top: 2px;"
         )
-        drop_hint.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        btn_layout.addWidget(drop_hint)
+        hint_row.addWidget(drop_hint)
+        hint_row.addStretch()
+        btn_layout.addLayout(hint_row)
 
         layout.addWidget(btn_frame)
 
@@ -386,17 +741,25 @@ class FileBrowserPanel(QFrame):
 
         image_paths: List[Path] = []
         for url in event.mimeData().urls():
-            path = Path(url.toLocalFile())
-            if path.is_dir():
+            local = url.toLocalFile()
+            if not local:
+                continue
+            try:
+                mode = os.stat(local).st_mode
+            except OSError:
+                continue
+            path = Path(local)
+            if stat.S_ISDIR(mode):
                 # Import all images from the dropped directory
-                for f in sorted(path.iterdir()):
-                    if f.is_file() and f.suffix.lower() in IMAGE_EXTENSIONS:
-                        image_paths.append(f)
-            elif path.is_file() and path.suffix.lower() in IMAGE_EXTENSIONS:
+                image_paths.extend(_scan_image_dir(path, sort=False))
+            elif stat.S_ISREG(mode) and path.suffix.lower() in IMAGE_EXTENSIONS:
                 image_paths.append(path)
 
         if image_paths:
-            self.add_images(image_paths)
+            # One sort for the whole drop: grouped by folder, then by name
+            pairs = [((str(p.parent).lower(), p.name.lower()), p) for p in image_paths]
+            pairs.sort(key=itemgetter(0))
+            self.add_images([p for _, p in pairs])
             event.acceptProposedAction()
         else:
             event.ignore()
@@ -411,72 +774,112 @@ class FileBrowserPanel(QFrame):
 
     def add_images(self, paths: List[Path]):
         """Add images to the file browser."""
-        new_paths = []
-        for p in paths:
-            key = str(p)
-            if key not in self._items:
-                item = ThumbnailItem(p)
-                item.clicked.connect(self._on_item_clicked)
-                self._list_layout.addWidget(item)
-                self._items[key] = item
-                new_paths.append(p)
+        new_paths = self._model.new_paths(paths)
+        if not new_paths:
+            return
 
-                # Check for existing caption .txt file
-                txt_path = p.with_suffix(".txt")
-                if txt_path.exists():
-                    try:
-                        caption = txt_path.read_text(encoding="utf-8").strip()
-                        item.set_caption_preview(caption)
-                        item.set_status("done")
-                    except Exception:
-                        pass
+        # One listing per folder tells us which caption sidecars exist,
+        # instead of an exists() call per image
+        sidecars: Dict[Path, Dict[str, str]] = {}   # normcase(name) -> name
+        for parent in {p.parent for p in new_paths}:
+            try:
+                with os.scandir(parent) as it:
+                    sidecars[parent] = {
+                        os.path.normcase(e.name): e.name
+                        for e in it if e.name.lower().endswith(".txt")
+                    }
+            except OSError:
+                sidecars[parent] = {}
+
+        # Resolve every row's caption first (existing caption .txt → "done"),
+        # then insert them all at once so the view lays out a single time
+        txt_paths: List[Optional[Path]] = []
+        for p in new_paths:
+            txt_name = sidecars[p.parent].get(
+                os.path.normcase(p.name.rsplit(".", 1)[0] + ".txt")
+            )
+            txt_paths.append(p.parent / txt_name if txt_name is not None else None)
+
+        # Read the existing sidecars concurrently, results in input order
+        n_captions = sum(t is not None for t in txt_paths)
+        if n_captions > 1:
+            with ThreadPoolExecutor(max_workers=min(_CAPTION_READ_WORKERS, n_captions)) as ex:
+                captions = list(ex.map(_read_caption_safe, txt_paths))
+        else:
+            captions = [_read_caption_safe(t) for t in txt_paths]
 
-        self.count_label.setText(str(len(self._items)))
+        first_new = self._model.rowCount()
+        self._list_view.setUpdatesEnabled(False)
+        try:
+            self._model.append_files(new_paths, captions)
+            # Rows already listed keep their filter state; only test the new ones
+            if self.search_input.text():
+                self._filter_items(self.search_input.text(), first_new)
+        finally:
+            self._list_view.setUpdatesEnabled(True)
 
-        if new_paths:
-            self.images_imported.emit(new_paths)
+        self.count_label.setText(str(self._model.rowCount()))
+        self.images_imported.emit(new_paths)
 
     def clear_all(self):
         """Remove all items from the file browser."""
-        for item in self._items.values():
-            item.setParent(None)
-            item.deleteLater()
-        self._items.clear()
+        self._model.clear()
         self._current_selection = None
         self.count_label.setText("0")
 
     def get_all_paths(self) -> List[Path]:
         """Return all image paths in the browser."""
-        return [item.image_path for item in self._items.values()]
+        return self._model.paths()
+
+    def get_neighbors(self, path: Path) -> List[Path]:
+        """The nearest visible images after and before *path* (for prefetching).
+
+        Rows hidden by the search filter are skipped, since the user cannot
+        navigate to them.
+        """
+        row = self._model.row_of(path)
+        if row < 0:
+            return []
+        neighbors = []
+        for step in (1, -1):
+            r = row + step
+            while 0 <= r < self._model.rowCount() and self._list_view.isRowHidden(r):
+                r += step
+            if 0 <= r < self._model.rowCount():
+                neighbors.append(self._model.index(r, 0).data(FileListModel.PathRole))
+        return neighbors
 
     def set_item_status(self, path: Path, status: str):
         """Update the status badge for a specific item."""
-        key = str(path)
-        if key in self._items:
-            self._items[key].set_status(status)
+        self._model.set_status(path, status)
 
     def set_item_caption(self, path: Path, caption: str):
         """Set the caption preview for a specific item."""
-        key = str(path)
-        if key in self._items:
-            self._items[key].set_caption_preview(caption)
+        self._model.set_caption_preview(path, caption)
 
     def select_item(self, path: Path):
         """Programmatically select an item."""
         self._on_item_clicked(path)
 
+    def _on_current_changed(self, current: QModelIndex, previous: QModelIndex):
+        """Current row moved by click or keyboard — select that image."""
+        if self._selecting or not current.isValid():
+            return
+        path = current.data(FileListModel.PathRole)
+        self._current_selection = path
+        self.image_selected.emit(path)
+
     def _on_item_clicked(self, path: Path):
-        """Handle thumbnail click — update selection and emit signal."""
-        # Deselect previous
-        if self._current_selection:
-            key = str(self._current_selection)
-            if key in self._items:
-                self._items[key].set_selected(False)
-
-        # Select new
-        key = str(path)
-        if key in self._items:
-            self._items[key].set_selected(True)
+        """Move the current row to *path* and emit the selection once."""
+        row = self._model.row_of(path)
+        if row >= 0:
+            idx = self._model.index(row, 0)
+            self._selecting = True
+            try:
+                self._list_view.setCurrentIndex(idx)
+            finally:
+                self._selecting = False
+            self._list_view.scrollTo(idx)
 
         self._current_selection = path
         self.image_selected.emit(path)
@@ -501,7 +904,7 @@ class FileBrowserPanel(QFrame):
 
     def _on_clear_clicked(self):
         """Clear all loaded images and reset for a new dataset."""
-        if not self._items:
+        if not self._model.rowCount():
             return
         self.clear_all()
         self.clear_requested.emit()
@@ -511,15 +914,18 @@ class FileBrowserPanel(QFrame):
         if not dir_path.is_dir():
             return
 
-        image_paths = sorted([
-            f for f in dir_path.iterdir()
-            if f.is_file() and f.suffix.lower() in IMAGE_EXTENSIONS
-        ])
-        self.add_images(image_paths)
+        self.add_images(_scan_image_dir(dir_path))
+
+    def _schedule_filter(self, _text: str = ""):
+        self._filter_timer.start()
 
-    def _filter_items(self, text: str):
-        """Filter visible thumbnails based on search text."""
+    def _filter_items(self, text: str, first_row: int = 0):
+        """Filter visible thumbnails based on search text (rows from *first_row* on)."""
         text_lower = text.lower()
-        for key, item in self._items.items():
-            visible = text_lower in item.image_path.name.lower() if text_lower else True
-            item.setVisible(visible)
+        names = self._model.names_lower()
+        self._list_view.setUpdatesEnabled(False)
+        try:
+            for row in range(first_row, len(names)):
+                self._list_view.setRowHidden(row, bool(text_lower) and text_lower not in names[row])
+        finally:
+            self._list_view.setUpdatesEnabled(True)
@@ -0,0 +1,89 @@
+"""
+GPU statistics for VL-CAPTIONER Studio Pro.
+
+All NVML reads go through get_gpu_snapshot(), which caches the last result
+for a short TTL so any number of readers costs at most one driver
+round-trip per second.
+"""
+
+import atexit
+import time
+import warnings
+from typing import NamedTuple, Optional, Tuple
+
+_TTL_SECONDS = 1.0
+
+_pynvml = None
+_handle = None
+_initialized = False   # nvmlInit() has succeeded in this process
+
+# (monotonic timestamp, snapshot or None on failure)
+_cache: Optional[Tuple[float, Optional["GpuSnapshot"]]] = None
+
+
+class GpuSnapshot(NamedTuple):
+    util_pct: Optional[int]       # None if the device doesn't report it
+    mem_used_mb: float
+    mem_total_mb: float
+    power_w: Optional[float]      # None if the device doesn't report it
+
+
+def init_nvml(index: int = 0) -> bool:
+    """Initialize NVML once per process and resolve the device handle.
+
+    Returns True if GPU stats are available. Safe to call again after a
+    failure (e.g. to re-probe once a driver has been loaded).
+    """
+    global _pynvml, _handle, _initialized, _cache
+    if _handle is not None:
+        return True
+    try:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", category=FutureWarning, module="pynvml")
+            import pynvml
+        if not _initialized:
+            pynvml.nvmlInit()
+            _initialized = True
+            atexit.register(pynvml.nvmlShutdown)
+        _handle = pynvml.nvmlDeviceGetHandleByIndex(index)
+        _pynvml = pynvml
+        _cache = None
+        return True
+    except Exception:
+        _handle = None
+        return False
+
+
+def get_gpu_snapshot() -> Optional[GpuSnapshot]:
+    """Return current GPU stats, or None if NVML is unavailable or failing.
+
+    Results (including failures) are reused for _TTL_SECONDS.
+    """
+    global _cache
+    if _handle is None:
+        return None
+    now = time.monotonic()
+    if _cache is not None and now - _cache[0] < _TTL_SECONDS:
+        return _cache[1]
+
+    snapshot = None
+    try:
+        mem = _pynvml.nvmlDeviceGetMemoryInfo(_handle)
+        try:
+            util = int(_pynvml.nvmlDeviceGetUtilizationRates(_handle).gpu)
+        except Exception:
+            util = None
+        try:
+            power = _pynvml.nvmlDeviceGetPowerUsage(_handle) / 1000.0   # mW -> W
+        except Exception:
+            power = None
+        snapshot = GpuSnapshot(
+            util_pct=util,
+            mem_used_mb=mem.used / (1024 ** 2),
+            mem_total_mb=mem.total / (1024 ** 2),
+            power_w=power,
+        )
+    except Exception:
+        pass
+    _cache = (now, snapshot)
+    return snapshot
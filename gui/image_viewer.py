@@ -6,63 +6,199 @@ maximize) and a processing overlay during caption generation. Matches the
 Figma "VL-CAPTIONER Studio Pro" CaptionWorkspace design.
 """
 
+import os
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Sequence, Tuple
 
-from PyQt6.QtCore import Qt, QSize, QTimer, pyqtSignal
-from PyQt6.QtGui import QPixmap, QImage, QWheelEvent, QPainter, QColor, QPen, QFont
+from PyQt6.QtCore import Qt, QMargins, QRectF, QSize, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QPixmap, QImage, QImageIOHandler, QImageReader, QWheelEvent, QPainter, QColor, QPen, QFont
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QFrame, QSizePolicy, QScrollArea,
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QFrame, QScrollArea,
 )
 
 from gui.theme import COLORS
 
 
+class _ImageLoadSignals(QObject):
+    # str(path), decoded image (null on failure), full-resolution size
+    loaded = pyqtSignal(str, QImage, QSize)
+
+
+# Formats the raster paint engine draws directly (JPEG decodes to RGB32)
+_NATIVE_FORMATS = (QImage.Format.Format_RGB32, QImage.Format.Format_ARGB32_Premultiplied)
+
+
+class _ImageLoader(QRunnable):
+    """Decodes one image to a QImage off the GUI thread (QPixmap is GUI-only).
+
+    With *max_side* > 0 the decoder downscales while reading (JPEG can skip
+    most of the work), so the longer edge is at most *max_side* pixels.
+    """
+
+    def __init__(self, path: str, signals: _ImageLoadSignals, max_side: int = 0):
+        super().__init__()
+        self._path = path
+        self._signals = signals
+        self._max_side = max_side
+
+    def run(self):
+        reader = QImageReader(self._path)
+        # Qt 6 refuses decodes over 256 MB by default (e.g. a 10k×7k JPEG)
+        reader.setAllocationLimit(0)
+        reader.setAutoTransform(True)
+
+        full_size = reader.size()   # header only; stored orientation
+        if self._max_side > 0 and full_size.isValid():
+            longest = max(full_size.width(), full_size.height())
+            if longest > self._max_side:
+                scale = self._max_side / longest
+                reader.setScaledSize(QSize(
+                    max(1, round(full_size.width() * scale)),
+                    max(1, round(full_size.height() * scale)),
+                ))
+        if reader.transformation() & QImageIOHandler.Transformation.TransformationRotate90:
+            full_size.transpose()   # report the size as displayed
+
+        image = reader.read()
+        if not full_size.isValid():
+            full_size = image.size()
+        # Convert here, off the GUI thread, so QPixmap.fromImage() can take
+        # the image as-is instead of converting it on the GUI thread
+        if not image.isNull() and image.format() not in _NATIVE_FORMATS:
+            image.convertTo(QImage.Format.Format_ARGB32_Premultiplied)
+        self._signals.loaded.emit(self._path, image, full_size)
+
+
+class _PixmapLRU:
+    """Recently viewed images, evicted least-recently-used past a byte budget."""
+
+    def __init__(self, limit_bytes: int):
+        self._limit = limit_bytes
+        self._used = 0
+        self._entries: "OrderedDict[str, Tuple[QPixmap, QSize]]" = OrderedDict()
+
+    @staticmethod
+    def _cost(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8)
+
+    def get(self, key: str) -> Optional[Tuple[QPixmap, QSize]]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, pixmap: QPixmap, full_size: QSize):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._used -= self._cost(old[0])
+        cost = self._cost(pixmap)
+        if cost > self._limit:
+            return
+        self._entries[key] = (pixmap, full_size)
+        self._used += cost
+        while self._used > self._limit:
+            _, (evicted, _) = self._entries.popitem(last=False)
+            self._used -= self._cost(evicted)
+
+
+_VIEW_CACHE = _PixmapLRU(256 * 1024 * 1024)
+
+
+def _cache_key(path: str) -> Optional[str]:
+    """View-cache key: changes whenever the file is rewritten."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return f"{path}:{st.st_mtime_ns}:{st.st_size}"
+
+
 class _SpinnerWidget(QWidget):
     """Animated spinner for the processing overlay."""
 
+    _INTERVAL_MS = 60   # ~16 fps is plenty for a spinner
+    _STEP_DEG = 12      # 200°/s, same speed as the old 6° per 30 ms
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(48, 48)
         self._angle = 0
+        # Ring + arc rasterised once; re-rendered only if the palette changes
+        self._sprite_colors = ("", "")
+        self._sprite = QPixmap()
         self._timer = QTimer(self)
         self._timer.timeout.connect(self._rotate)
-        self._timer.start(30)
+        app = QApplication.instance()
+        if app is not None:
+            # No point spinning while the window is in the background
+            app.applicationStateChanged.connect(self._on_app_state_changed)
+
+    def _on_app_state_changed(self, state: Qt.ApplicationState):
+        if state == Qt.ApplicationState.ApplicationActive:
+            self.start()
+        else:
+            self.stop()
 
     def _rotate(self):
-        self._angle = (self._angle + 6) % 360
+        self._angle = (self._angle + self._STEP_DEG) % 360
         self.update()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.stop()
+
+    def _get_sprite(self) -> QPixmap:
+        colors = (COLORS["border"], COLORS["accent"])
+        if colors != self._sprite_colors:
+            sprite = QPixmap(96, 96)            # 2x for crisp HiDPI rendering
+            sprite.setDevicePixelRatio(2.0)
+            sprite.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(sprite)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.translate(24, 24)
+
+            # Ring
+            pen = QPen(QColor(colors[0]), 2.5)
+            painter.setPen(pen)
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawEllipse(-18, -18, 36, 36)
+
+            # Active arc (top portion)
+            pen.setColor(QColor(colors[1]))
+            painter.setPen(pen)
+            painter.drawArc(-18, -18, 36, 36, 90 * 16, 80 * 16)
+
+            painter.end()
+            self._sprite, self._sprite_colors = sprite, colors
+        return self._sprite
+
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
         painter.translate(24, 24)
         painter.rotate(self._angle)
-
-        # Ring
-        pen = QPen(QColor(COLORS["border"]), 2.5)
-        painter.setPen(pen)
-        painter.setBrush(Qt.BrushStyle.NoBrush)
-        painter.drawEllipse(-18, -18, 36, 36)
-
-        # Active arc (top portion)
-        pen.setColor(QColor(COLORS["accent"]))
-        painter.setPen(pen)
-        painter.drawArc(-18, -18, 36, 36, 90 * 16, 80 * 16)
-
-        painter.end()
+        painter.translate(-24, -24)
+        painter.drawPixmap(0, 0, self._get_sprite())
 
     def stop(self):
         self._timer.stop()
 
     def start(self):
-        self._timer.start(30)
+        if self.isVisible():
+            self._timer.start(self._INTERVAL_MS)
 
 
 class ProcessingOverlay(QWidget):
     """Semi-transparent overlay with spinner shown during caption generation."""
 
+    _BACKDROP = QColor(9, 9, 11, 100)  # zinc-950/40
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, False)
@@ -104,22 +240,78 @@ class ProcessingOverlay(QWidget):
         layout.addWidget(card)
 
     def paintEvent(self, event):
-        """Draw the semi-transparent backdrop."""
+        """Draw the semi-transparent backdrop (only the invalidated part)."""
         painter = QPainter(self)
-        painter.fillRect(self.rect(), QColor(9, 9, 11, 100))  # zinc-950/40
-        painter.end()
+        painter.fillRect(event.rect(), self._BACKDROP)
+        painter.end()   # finish before the base class paints
         super().paintEvent(event)
 
     def show_overlay(self):
-        self._spinner.start()
+        # The spinner starts/stops itself from its show/hide events
         self.setVisible(True)
         self.raise_()
 
     def hide_overlay(self):
-        self._spinner.stop()
         self.setVisible(False)
 
 
+_PLACEHOLDER_TEXT = "Select an image from the sidebar to start captioning"
+
+
+class _ImageCanvas(QWidget):
+    """Scroll-area content that paints only the exposed part of the image.
+
+    The widget is sized to the zoomed image, but a zoomed copy is never
+    allocated: each paint maps the exposed rect back onto the source
+    pixmap and lets QPainter scale just that region. Memory stays bounded
+    by the source, whatever the zoom level.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._source = QPixmap()
+        self._smooth = True
+        self._message = ""
+
+    def set_image(self, source: QPixmap, size: QSize, smooth: bool):
+        """Show *source* stretched to *size* (the zoomed image size)."""
+        self._source = source
+        self._smooth = smooth
+        self._message = ""
+        self.resize(size)
+        self.update()
+
+    def show_message(self, text: str, size: QSize):
+        """Replace the image with a centred placeholder message."""
+        self._source = QPixmap()
+        self._message = text
+        self.resize(size)
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        if self._source.isNull():
+            if self._message:
+                font = QFont(self.font())
+                font.setPixelSize(14)
+                painter.setFont(font)
+                painter.setPen(QColor(COLORS["text_muted"]))
+                painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, self._message)
+            return
+
+        target = event.rect().intersected(self.rect())
+        if self._source.size() == self.size():
+            painter.drawPixmap(target, self._source, target)   # 1:1 blit
+        else:
+            sx = self._source.width() / self.width()
+            sy = self._source.height() / self.height()
+            source_rect = QRectF(target.x() * sx, target.y() * sy,
+                                 target.width() * sx, target.height() * sy)
+            if self._smooth:
+                painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+            painter.drawPixmap(QRectF(target), self._source, source_rect)
+
+
 class ImageViewer(QFrame):
     """
     Center panel image viewer with canvas toolbar and processing overlay.
@@ -128,9 +320,33 @@ class ImageViewer(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setProperty("class", "image-viewer")
+        # Decoded image; may be a reduced decode of an image of _full_size,
+        # upgraded to full resolution the first time zoom needs more pixels
         self._pixmap: Optional[QPixmap] = None
+        self._full_size = QSize()
+        self._full_requested = False
+        self._loaded_path: Optional[str] = None
+        self._image_key: Optional[str] = None   # str(_image_path), built once
+        self._cache_key: Optional[str] = None   # path:mtime_ns:size of _image_path
+        # Smooth downscale of _pixmap at ~2x the viewport; zoom levels up to
+        # _display_scale are scaled from it instead of the full-size original
+        self._display_pixmap: Optional[QPixmap] = None
+        self._display_scale: float = 1.0
+        self._display_stale = False   # viewport changed since it was built
+        self._last_fit_size = QSize(0, 0)   # viewport size at the last fit
         self._zoom: float = 1.0
         self._image_path: Optional[Path] = None
+        self._load_signals = _ImageLoadSignals(self)
+        self._load_signals.loaded.connect(self._on_image_loaded)
+
+        # Neighbouring images are decoded ahead into the view cache, two at
+        # a time, so stepping through a folder rarely waits on a decode
+        self._prefetch_pool = QThreadPool(self)
+        self._prefetch_pool.setMaxThreadCount(2)
+        self._prefetch_signals = _ImageLoadSignals(self)
+        self._prefetch_signals.loaded.connect(self._on_prefetch_loaded)
+        self._prefetching: Dict[str, str] = {}   # str(path) -> cache key
+        self._prefetch_next: Sequence[Path] = ()
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -198,8 +414,10 @@ class ImageViewer(QFrame):
         layout.addWidget(toolbar)
 
         # ── Image display area ──
+        # The scroll area covers the container completely and its viewport
+        # paints the solid backdrop, so nothing underneath needs filling
         self._image_container = QWidget()
-        self._image_container.setStyleSheet(f"background: {COLORS['bg_darkest']};")
+        self._image_container.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
         container_layout = QVBoxLayout(self._image_container)
         container_layout.setContentsMargins(0, 0, 0, 0)
         container_layout.setSpacing(0)
@@ -208,17 +426,12 @@ class ImageViewer(QFrame):
         self._scroll.setStyleSheet(f"background: {COLORS['bg_darkest']}; border: none;")
         self._scroll.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self._scroll.setWidgetResizable(False)
+        self._scroll.viewport().setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
 
-        self._image_label = QLabel("Select an image from the sidebar to start captioning")
-        self._image_label.setStyleSheet(
-            f"color: {COLORS['text_muted']}; font-size: 14px; background: transparent;"
-        )
-        self._image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self._image_label.setSizePolicy(
-            QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
-        )
+        self._canvas = _ImageCanvas()
+        self._canvas.show_message(_PLACEHOLDER_TEXT, self._scroll.viewport().size())
 
-        self._scroll.setWidget(self._image_label)
+        self._scroll.setWidget(self._canvas)
         container_layout.addWidget(self._scroll, 1)
 
         layout.addWidget(self._image_container, 1)
@@ -226,30 +439,130 @@ class ImageViewer(QFrame):
         # ── Processing overlay ──
         self._overlay = ProcessingOverlay(self._image_container)
 
-    def set_image(self, image_path: Path):
-        """Load and display an image from a file path."""
+        # Dragging a window border sends a burst of resize events; refit
+        # (a full smooth rescale) once the burst settles
+        self._refit_timer = QTimer(self)
+        self._refit_timer.setSingleShot(True)
+        self._refit_timer.setInterval(16)
+        self._refit_timer.timeout.connect(self._on_view_resized)
+
+        # Wheel/button zoom: at most one fast frame per ~16 ms however fast
+        # the wheel events arrive, then one smooth pass once zooming stops
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(16)
+        self._zoom_timer.timeout.connect(self._render_zoom_frame)
+
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(150)
+        self._smooth_timer.timeout.connect(self._render_smooth)
+
+    def set_image(self, image_path: Path, prefetch: Sequence[Path] = ()):
+        """Load and display an image from a file path.
+
+        Decoding runs on the thread pool; the current image stays on screen
+        until the new one is ready. Once it is shown, the *prefetch* paths
+        (typically the previous/next images) are decoded into the cache.
+        """
+        path_str = str(image_path)
         self._image_path = image_path
-        self._pixmap = QPixmap(str(image_path))
+        self._image_key = path_str
+        self._loaded_path = None
+        self._full_requested = False
+        self._prefetch_next = prefetch
 
-        if self._pixmap.isNull():
-            self._image_label.setText(f"Failed to load: {image_path.name}")
-            self.filename_label.setText("Error")
+        # Decode at 2x the viewport's longer edge — enough for fit-to-view
+        # plus some zoom; more is decoded only if the user zooms further
+        view_size = self._scroll.size()
+        max_side = max(view_size.width(), view_size.height()) * 2
+
+        self._cache_key = _cache_key(path_str)   # the only stat() on this path
+        cached = _VIEW_CACHE.get(self._cache_key) if self._cache_key else None
+        if cached is not None:
+            pixmap, full_size = cached
+            longest = max(full_size.width(), full_size.height())
+            # A reduced decode only serves if it is big enough for this viewport
+            if max(pixmap.width(), pixmap.height()) >= min(max_side, longest):
+                self._show_pixmap(pixmap, full_size, upgrade=False)
+                return
+
+        self.filename_label.setText(f"{image_path.name}    Loading\u2026")
+        QThreadPool.globalInstance().start(
+            _ImageLoader(path_str, self._load_signals, max_side)
+        )
+
+    def _on_image_loaded(self, key: str, image: QImage, full_size: QSize):
+        image_path = self._image_path
+        if image_path is None or key != self._image_key:
+            return  # cleared, or another image was selected meanwhile
+
+        upgrade = self._loaded_path == key   # full-resolution re-decode
+        if image.isNull():
+            if not upgrade:  # otherwise keep showing the reduced decode
+                self._pixmap = QPixmap()
+                self._display_pixmap = None
+                self._canvas.show_message(
+                    f"Failed to load: {image_path.name}", self._scroll.viewport().size()
+                )
+                self.filename_label.setText("Error")
+            return
+
+        pixmap = QPixmap.fromImage(image)
+        if self._cache_key:
+            _VIEW_CACHE.put(self._cache_key, pixmap, full_size)
+        self._show_pixmap(pixmap, full_size, upgrade)
+
+    def _show_pixmap(self, pixmap: QPixmap, full_size: QSize, upgrade: bool):
+        """Display a decoded image of the current path (*upgrade*: keep the zoom)."""
+        image_path = self._image_path
+        self._pixmap = pixmap
+        self._loaded_path = self._image_key
+        self._full_size = full_size
+        self._rebuild_display_pixmap()
+        if upgrade:
+            self._apply_zoom()
             return
 
         self.filename_label.setText(
             f"{image_path.name}    "
-            f"{self._pixmap.width()}\u00d7{self._pixmap.height()}"
+            f"{full_size.width()}\u00d7{full_size.height()}"
         )
 
         # Fit to view on first load
         self._fit_to_view()
+        self._start_prefetch()
+
+    def _start_prefetch(self):
+        paths, self._prefetch_next = self._prefetch_next, ()
+        view_size = self._scroll.size()
+        max_side = max(view_size.width(), view_size.height()) * 2
+        for path in paths:
+            path_str = str(path)
+            if path_str in self._prefetching:
+                continue
+            key = _cache_key(path_str)
+            if key is None or _VIEW_CACHE.get(key):
+                continue
+            self._prefetching[path_str] = key
+            self._prefetch_pool.start(_ImageLoader(path_str, self._prefetch_signals, max_side))
+
+    def _on_prefetch_loaded(self, path: str, image: QImage, full_size: QSize):
+        key = self._prefetching.pop(path, None)
+        if key is not None and not image.isNull():
+            _VIEW_CACHE.put(key, QPixmap.fromImage(image), full_size)
 
     def clear(self):
         """Clear the current image."""
         self._pixmap = None
+        self._full_size = QSize()
+        self._loaded_path = None
+        self._image_key = None
+        self._cache_key = None
+        self._display_pixmap = None
+        self._display_scale = 1.0
         self._image_path = None
-        self._image_label.setPixmap(QPixmap())
-        self._image_label.setText("Select an image from the sidebar to start captioning")
+        self._canvas.show_message(_PLACEHOLDER_TEXT, self._scroll.viewport().size())
         self.filename_label.setText("No image loaded")
         self.zoom_label.setText("100%")
         self._zoom = 1.0
@@ -261,45 +574,109 @@ class ImageViewer(QFrame):
         else:
             self._overlay.hide_overlay()
 
-    def _fit_to_view(self):
+    def _fit_to_view(self, smooth: bool = True):
         """Scale image to fit the current view area."""
         if not self._pixmap or self._pixmap.isNull():
             return
 
         view_size = self._scroll.size()
-        img_w = self._pixmap.width()
-        img_h = self._pixmap.height()
+        img_w = self._full_size.width()
+        img_h = self._full_size.height()
 
-        if img_w == 0 or img_h == 0:
+        if img_w <= 0 or img_h <= 0:
             return
+        self._last_fit_size = view_size
 
-        # Calculate scale to fit
-        scale_w = (view_size.width() - 20) / img_w
-        scale_h = (view_size.height() - 20) / img_h
-        self._zoom = min(scale_w, scale_h, 1.0)  # Don't upscale beyond 100%
+        # Calculate scale to fit (10 px margin all round)
+        target = self._full_size.scaled(
+            view_size.shrunkBy(QMargins(10, 10, 10, 10)),
+            Qt.AspectRatioMode.KeepAspectRatio,
+        )
+        if target.isEmpty():
+            return
+        self._zoom = min(target.width() / img_w, 1.0)  # Don't upscale beyond 100%
 
-        self._apply_zoom()
+        self._apply_zoom(smooth)
 
     def _set_zoom(self, new_zoom: float):
-        """Set a specific zoom level."""
+        """Set a specific zoom level (interactive: fast frame, smooth pass later)."""
         self._zoom = max(0.1, min(5.0, new_zoom))
+        self.zoom_label.setText(f"{int(self._zoom * 100)}%")
+        if not self._zoom_timer.isActive():
+            self._zoom_timer.start()
+
+    def _render_zoom_frame(self):
+        self._apply_zoom(smooth=False)
+        self._smooth_timer.start()
+
+    def _render_smooth(self):
+        """Interaction stopped: full-quality render (and re-cache if resized)."""
+        if self._display_stale:
+            self._rebuild_display_pixmap()
         self._apply_zoom()
 
-    def _apply_zoom(self):
-        """Apply the current zoom level to the displayed image."""
+    def _rebuild_display_pixmap(self):
+        """Cache a smooth downscale of the image sized to ~2x the viewport."""
+        self._display_pixmap = None
+        self._display_scale = 1.0
+        self._display_stale = False
         if not self._pixmap or self._pixmap.isNull():
             return
 
-        new_w = int(self._pixmap.width() * self._zoom)
-        new_h = int(self._pixmap.height() * self._zoom)
+        view_size = self._scroll.size()
+        img_w = self._pixmap.width()
+        img_h = self._pixmap.height()
+        scale = min(view_size.width() * 2 / img_w, view_size.height() * 2 / img_h)
+        if scale >= 1.0:
+            return  # image is already viewport-sized; scale from the original
 
-        scaled = self._pixmap.scaled(
-            new_w, new_h,
+        self._display_pixmap = self._pixmap.scaled(
+            max(1, int(img_w * scale)), max(1, int(img_h * scale)),
             Qt.AspectRatioMode.KeepAspectRatio,
             Qt.TransformationMode.SmoothTransformation,
         )
-        self._image_label.setPixmap(scaled)
-        self._image_label.resize(scaled.size())
+        self._display_scale = self._display_pixmap.width() / self._full_size.width()
+
+    def _apply_zoom(self, smooth: bool = True):
+        """Apply the current zoom level to the displayed image."""
+        if not self._pixmap or self._pixmap.isNull():
+            return
+        if smooth:
+            self._zoom_timer.stop()
+            self._smooth_timer.stop()
+
+        new_w = max(1, int(self._full_size.width() * self._zoom))
+        new_h = max(1, int(self._full_size.height() * self._zoom))
+
+        # Zoomed in past the reduced decode: upscale it for now and fetch
+        # the full-resolution image once
+        if (new_w > self._pixmap.width() and self._pixmap.width() < self._full_size.width()
+                and not self._full_requested and self._image_key is not None):
+            self._full_requested = True
+            QThreadPool.globalInstance().start(
+                _ImageLoader(self._image_key, self._load_signals)
+            )
+
+        # Zoomed out far enough, the cached downscale has all the detail needed
+        source = self._pixmap
+        if self._display_pixmap is not None and self._zoom <= self._display_scale:
+            source = self._display_pixmap
+
+        view = self._scroll.viewport().size()
+        if new_w <= view.width() and new_h <= view.height():
+            # Fits on screen: one viewport-bounded copy, area-averaged when
+            # smooth (better than per-paint bilinear for big reductions)
+            scaled = source.scaled(
+                new_w, new_h,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation if smooth
+                else Qt.TransformationMode.FastTransformation,
+            )
+            self._canvas.set_image(scaled, scaled.size(), smooth)
+        else:
+            # Larger than the viewport: no zoomed copy, the canvas scales
+            # only the visible region on each paint
+            self._canvas.set_image(source, QSize(new_w, new_h), smooth)
 
         self.zoom_label.setText(f"{int(self._zoom * 100)}%")
 
@@ -307,11 +684,23 @@ class ImageViewer(QFrame):
         """Reset to fit-to-view zoom level."""
         self._fit_to_view()
 
+    def _on_view_resized(self):
+        """The viewport changed size: fast refit now, smooth (and re-cache) at rest."""
+        cur = self._scroll.size()
+        if (abs(cur.width() - self._last_fit_size.width()) < 4
+                and abs(cur.height() - self._last_fit_size.height()) < 4):
+            return  # a few pixels either way — the 10 px fit margin absorbs it
+        self._display_stale = True
+        self._fit_to_view(smooth=False)
+        self._smooth_timer.start()
+
     def resizeEvent(self, event):
         """Re-fit image when the viewer is resized and keep overlay sized."""
         super().resizeEvent(event)
         if self._pixmap and not self._pixmap.isNull():
-            self._fit_to_view()
+            self._refit_timer.start()
+        else:
+            self._canvas.resize(self._scroll.viewport().size())  # keep message centred
         # Keep overlay filling the image container
         self._overlay.setGeometry(self._image_container.rect())
 
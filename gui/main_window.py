@@ -9,13 +9,18 @@ Orchestrates the three-panel layout:
 Wires up signals between all components and the inference engine.
 """
 
+import os
 import sys
+import time
 import traceback
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
 
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QObject, QTimer
-from PyQt6.QtGui import QFont, QAction, QPainter, QColor, QPen, QBrush, QScreen
+from PyQt6.QtCore import (
+    Qt, QEvent, QThread, pyqtSignal, QObject, QTimer, QRunnable, QThreadPool,
+)
+from PyQt6.QtGui import QFont, QAction, QPainter, QColor, QPen, QBrush, QScreen, QPixmap
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QFrame, QSplitter, QStatusBar, QProgressBar, QApplication, QFileDialog,
@@ -26,11 +31,58 @@ from gui.file_browser import FileBrowserPanel
 from gui.image_viewer import ImageViewer
 from gui.caption_panel import CaptionPanel
 from gui.settings_panel import SettingsPanel
-from gui.dataset_panel import DatasetPanel
 from gui.notification_panel import NotificationStore, NotificationPanel
-from gui.theme import COLORS
-from engine.inference import Qwen3VLEngine, is_image_file
-from engine.model_downloader import ensure_mmproj, find_mmproj_file
+from gui import gpu_stats
+
+# The inference engine (Pillow, llama-cpp-python) and the Dataset tab are
+# imported on first use to keep time-to-first-window short
+if TYPE_CHECKING:
+    from engine.inference import Qwen3VLEngine
+    from gui.dataset_panel import DatasetPanel
+
+# Optional: system RAM readout in the status bar
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# A failed NVML init is re-probed once, this long after startup
+_NVML_RETRY_MS = 60 * 60 * 1000
+
+# Streamed tokens cross to the GUI thread in chunks: a token arriving this
+# long after the last chunk (or filling the buffer to this count) flushes it
+_TOKEN_FLUSH_SECONDS = 0.03
+_TOKEN_FLUSH_COUNT = 16
+
+# Worker -> GUI signals always hop to the GUI thread via its event loop; a
+# worker never runs (or waits on) a GUI slot itself
+_QUEUED = Qt.ConnectionType.QueuedConnection
+
+# In-memory caption cache size; evicted entries are re-read from their sidecar
+_MAX_CAPTION_CACHE = 4096
+
+
+class _TokenBuffer:
+    """Coalesces streamed tokens so each queued signal carries a chunk, not one token."""
+
+    def __init__(self, emit):
+        self._emit = emit
+        self._parts: List[str] = []
+        self._last_flush = time.monotonic()
+
+    def add(self, token: str):
+        self._parts.append(token)
+        now = time.monotonic()
+        if (now - self._last_flush >= _TOKEN_FLUSH_SECONDS
+                or len(self._parts) >= _TOKEN_FLUSH_COUNT):
+            self.flush(now)
+
+    def flush(self, now: Optional[float] = None):
+        if self._parts:
+            self._emit("".join(self._parts))
+            self._parts.clear()
+        self._last_flush = time.monotonic() if now is None else now
 
 
 # --- Worker for background model loading ---
@@ -40,11 +92,15 @@ class ModelLoadWorker(QObject):
     finished = pyqtSignal()
     error = pyqtSignal(str)
 
-    def __init__(self, engine: Qwen3VLEngine, model_path: Path, mmproj_path: Path):
+    def __init__(
+        self, engine: "Qwen3VLEngine", model_path: Path, mmproj_path: Path,
+        load_options: Optional[dict] = None,
+    ):
         super().__init__()
         self.engine = engine
         self.model_path = model_path
         self.mmproj_path = mmproj_path
+        self.load_options = load_options or {}
 
     def run(self):
         try:
@@ -52,6 +108,7 @@ class ModelLoadWorker(QObject):
                 self.model_path,
                 self.mmproj_path,
                 progress_callback=lambda msg: self.progress.emit(msg),
+                **self.load_options,
             )
             self.finished.emit()
         except Exception as e:
@@ -66,7 +123,7 @@ class CaptionWorker(QObject):
     error = pyqtSignal(str)
 
     def __init__(
-        self, engine: Qwen3VLEngine, image_path: Path,
+        self, engine: "Qwen3VLEngine", image_path: Path,
         prompt: str, temperature: float, top_p: float,
         max_tokens: int, prefix: str, suffix: str,
     ):
@@ -85,6 +142,7 @@ class CaptionWorker(QObject):
         self._cancelled = True
 
     def run(self):
+        tokens = _TokenBuffer(self.new_token.emit)
         try:
             caption = self.engine.caption_image(
                 image_path=self.image_path,
@@ -94,15 +152,99 @@ class CaptionWorker(QObject):
                 max_tokens=self.max_tokens,
                 prefix=self.prefix,
                 suffix=self.suffix,
-                stream_callback=lambda t: self.new_token.emit(t),
+                stream_callback=tokens.add,
                 cancel_check=lambda: self._cancelled,
             )
+            tokens.flush()
             self.finished.emit(caption)
         except Exception as e:
+            tokens.flush()
+            self.error.emit(f"{e}\n{traceback.format_exc()}")
+
+
+# --- Worker for batch caption generation ---
+class BatchCaptionWorker(QObject):
+    """Captions a list of images in one background thread.
+
+    Uses Qwen3VLEngine.caption_images so the next images are preprocessed
+    while the GPU is busy with the current one.
+    """
+    item_started = pyqtSignal(Path)
+    new_token = pyqtSignal(str)
+    item_finished = pyqtSignal(Path, str)  # image path, caption
+    finished = pyqtSignal()
+    error = pyqtSignal(str)
+
+    def __init__(
+        self, engine: "Qwen3VLEngine", image_paths: List[Path],
+        prompt: str, temperature: float, top_p: float,
+        max_tokens: int, prefix: str, suffix: str,
+    ):
+        super().__init__()
+        self.engine = engine
+        self.image_paths = list(image_paths)
+        self.prompt = prompt
+        self.temperature = temperature
+        self.top_p = top_p
+        self.max_tokens = max_tokens
+        self.prefix = prefix
+        self.suffix = suffix
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        tokens = _TokenBuffer(self.new_token.emit)
+        try:
+            if self.image_paths:
+                self.item_started.emit(self.image_paths[0])
+            results = self.engine.caption_images(
+                self.image_paths,
+                prompt=self.prompt,
+                temperature=self.temperature,
+                top_p=self.top_p,
+                max_tokens=self.max_tokens,
+                prefix=self.prefix,
+                suffix=self.suffix,
+                stream_callback=tokens.add,
+                cancel_check=lambda: self._cancelled,
+            )
+            for idx, (path, caption) in enumerate(results, start=1):
+                tokens.flush()   # this item's tail must land before the next starts
+                if self._cancelled:
+                    break
+                self.item_finished.emit(path, caption)
+                if idx < len(self.image_paths) and not self._cancelled:
+                    self.item_started.emit(self.image_paths[idx])
+            self.finished.emit()
+        except Exception as e:
+            tokens.flush()
             self.error.emit(f"{e}\n{traceback.format_exc()}")
 
 
+# --- Background caption sidecar writes ---
+class _SidecarSignals(QObject):
+    written = pyqtSignal(Path, str)   # image path, caption
+    failed = pyqtSignal(Path, str)    # image path, error message
+
 
+class _SidecarWriteTask(QRunnable):
+    """Writes one caption .txt sidecar off the GUI thread."""
+
+    def __init__(self, signals: _SidecarSignals, image_path: Path, caption: str):
+        super().__init__()
+        self._signals = signals
+        self._image_path = image_path
+        self._caption = caption
+
+    def run(self):
+        try:
+            self._image_path.with_suffix(".txt").write_text(self._caption, encoding="utf-8")
+        except Exception as e:
+            self._signals.failed.emit(self._image_path, str(e))
+            return
+        self._signals.written.emit(self._image_path, self._caption)
 
 
 class MainWindow(QMainWindow):
@@ -128,30 +270,48 @@ class MainWindow(QMainWindow):
             self.setGeometry(50, 50, 1400, 850)
 
         # State
-        self._engine = Qwen3VLEngine()
+        self._engine: Optional["Qwen3VLEngine"] = None   # created by _get_engine()
         self._model_dir = model_dir
         self._current_image: Optional[Path] = None
-        self._captions: Dict[str, str] = {}  # str(path) -> caption
+        # str(path) -> caption, least recently used first. Captions not yet
+        # written to a sidecar (_unsaved_captions) are never evicted.
+        self._captions: "OrderedDict[str, str]" = OrderedDict()
+        self._unsaved_captions: Set[str] = set()
+        # One directory listing per folder answers "does this image have a
+        # .txt sidecar?" for every selection in it (names are normcase'd)
+        self._sidecar_folder: Optional[Path] = None
+        self._sidecar_names: Set[str] = set()
 
         # Thread references — MUST be stored as instance attrs to prevent GC
         self._model_load_thread: Optional[QThread] = None
         self._model_load_worker: Optional[ModelLoadWorker] = None
         self._generation_thread: Optional[QThread] = None
-        self._caption_worker: Optional[CaptionWorker] = None
+        self._caption_worker: Optional[CaptionWorker | BatchCaptionWorker] = None
         self._is_generating = False
         self._batch_queue: List[Path] = []
         self._batch_index = 0
+        self._batch_cancelled = False
         self._download_thread: Optional[QThread] = None
         self._download_worker = None  # ModelDownloadWorker (lazy import)
 
         # NVML (GPU monitoring)
-        self._nvml_handle = None
+        self._nvml_available = False
         self._init_nvml()
 
-        # Periodic GPU refresh timer (5 seconds)
+        # Periodic GPU + RAM refresh timer (5 s default, see gui.config);
+        # paused while the window is minimized
+        from gui.config import get_gpu_poll_interval_ms
         self._gpu_timer = QTimer(self)
-        self._gpu_timer.setInterval(5000)
-        self._gpu_timer.timeout.connect(self._update_gpu_info)
+        self._gpu_timer.setInterval(get_gpu_poll_interval_ms())
+        self._gpu_timer.timeout.connect(self._on_status_tick)
+
+        # Batch captions are saved to sidecars on a small pool so disk writes
+        # never stall the GUI thread while the GPU moves on to the next image
+        self._sidecar_signals = _SidecarSignals(self)
+        self._sidecar_signals.written.connect(self._on_sidecar_written)
+        self._sidecar_signals.failed.connect(self._on_sidecar_failed)
+        self._io_pool = QThreadPool(self)
+        self._io_pool.setMaxThreadCount(2)
 
         # Notification system
         self._notification_store = NotificationStore(self)
@@ -163,9 +323,15 @@ class MainWindow(QMainWindow):
         self._build_status_bar()
         self._connect_signals()
 
-        # Kick off GPU monitoring immediately (don't wait for model load)
+        # Kick off GPU/RAM monitoring immediately (don't wait for model load).
+        # Without a usable NVIDIA driver the pill stays a static N/A; the
+        # timer then only runs if there is a RAM readout to refresh.
         self._update_gpu_info()
-        self._gpu_timer.start()
+        self._update_ram_info()
+        if self._polling_enabled():
+            self._gpu_timer.start()
+        if not self._nvml_available:
+            QTimer.singleShot(_NVML_RETRY_MS, self._retry_nvml)
 
     def _build_nav_bar(self):
         """Build the top navigation bar matching the Figma Header component."""
@@ -184,16 +350,14 @@ class MainWindow(QMainWindow):
         logo_path = Path(__file__).parent / "qwen-icon-logo-png_seeklogo-611724.png"
         logo_label = QLabel()
         logo_label.setFixedSize(28, 28)
-        if logo_path.exists():
-            from PyQt6.QtGui import QPixmap
-            pixmap = QPixmap(str(logo_path))
-            if not pixmap.isNull():
-                scaled = pixmap.scaled(
-                    28, 28,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                logo_label.setPixmap(scaled)
+        pixmap = QPixmap(str(logo_path))   # null if the file is missing
+        if not pixmap.isNull():
+            scaled = pixmap.scaled(
+                28, 28,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            logo_label.setPixmap(scaled)
         left_group.addWidget(logo_label)
 
         # Brand text block
@@ -203,23 +367,17 @@ class MainWindow(QMainWindow):
 
         brand_title = QLabel("QWEN 3 VL ABL Captioner")
         brand_title.setProperty("class", "brand-title")
-        brand_title.setStyleSheet(
-            f"color: {COLORS['text_primary']}; font-size: 13px; font-weight: 700; "
-            f"letter-spacing: 0.5px; padding: 0; margin: 0; background: transparent;"
-        )
+        brand_title.setObjectName("brandTitle")
         brand_block.addWidget(brand_title)
 
         brand_sub = QLabel("V1.2.0")
         brand_sub.setProperty("class", "brand-subtitle")
-        brand_sub.setStyleSheet(
-            f"color: {COLORS['text_dim']}; font-size: 9px; font-family: 'Consolas', 'Courier New', monospace; "
-            f"letter-spacing: 0.3px; padding: 0; margin: 0; background: transparent; text-transform: uppercase;"
-        )
+        brand_sub.setObjectName("brandSubtitle")
         brand_block.addWidget(brand_sub)
 
         brand_container = QWidget()
         brand_container.setLayout(brand_block)
-        brand_container.setStyleSheet("background: transparent;")
+        brand_container.setProperty("class", "bar-group")
         left_group.addWidget(brand_container)
 
         left_group.addSpacing(24)
@@ -236,7 +394,7 @@ class MainWindow(QMainWindow):
 
         left_widget = QWidget()
         left_widget.setLayout(left_group)
-        left_widget.setStyleSheet("background: transparent;")
+        left_widget.setProperty("class", "bar-group")
         nav_layout.addWidget(left_widget)
 
         nav_layout.addStretch()
@@ -252,30 +410,24 @@ class MainWindow(QMainWindow):
         gpu_pill_layout.setContentsMargins(10, 4, 10, 4)
         gpu_pill_layout.setSpacing(8)
 
-        # Emerald pulse dot + GPU %
+        # Emerald pulse dot + GPU % (colour follows the "level" property)
         self._gpu_dot = QLabel("\u2022")
-        self._gpu_dot.setStyleSheet(f"color: {COLORS['success']}; font-size: 14px; background: transparent;")
+        self._gpu_dot.setObjectName("gpuDot")
         gpu_pill_layout.addWidget(self._gpu_dot)
 
         self._gpu_label = QLabel("GPU: --")
-        self._gpu_label.setStyleSheet(
-            f"color: {COLORS['success']}; font-size: 10px; font-weight: 600; "
-            f"letter-spacing: 0.5px; text-transform: uppercase; background: transparent;"
-        )
+        self._gpu_label.setObjectName("gpuLabel")
         gpu_pill_layout.addWidget(self._gpu_label)
 
         # Vertical separator inside pill
         pill_sep = QFrame()
         pill_sep.setFixedSize(1, 14)
-        pill_sep.setStyleSheet(f"background: {COLORS['border']};")
+        pill_sep.setProperty("class", "v-separator")
         gpu_pill_layout.addWidget(pill_sep)
 
         # VRAM info
         self._vram_label = QLabel("-- VRAM")
-        self._vram_label.setStyleSheet(
-            f"color: {COLORS['text_dim']}; font-size: 10px; font-weight: 500; "
-            f"letter-spacing: 0.5px; text-transform: uppercase; background: transparent;"
-        )
+        self._vram_label.setObjectName("vramLabel")
         gpu_pill_layout.addWidget(self._vram_label)
 
         right_group.addWidget(gpu_pill)
@@ -308,11 +460,7 @@ class MainWindow(QMainWindow):
         self._bell_badge = QLabel("0", self._bell_btn)
         self._bell_badge.setFixedSize(16, 16)
         self._bell_badge.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self._bell_badge.setStyleSheet(
-            f"background-color: {COLORS['error']}; color: #ffffff; "
-            f"font-size: 9px; font-weight: 700; border-radius: 8px; "
-            f"border: none; padding: 0px;"
-        )
+        self._bell_badge.setObjectName("bellBadge")
         self._bell_badge.move(self._bell_btn.width() - 14, -2)
         self._bell_badge.setVisible(False)
 
@@ -322,29 +470,24 @@ class MainWindow(QMainWindow):
         # Vertical separator
         sep = QFrame()
         sep.setFixedSize(1, 24)
-        sep.setStyleSheet(f"background: {COLORS['border']};")
+        sep.setProperty("class", "v-separator")
         right_group.addWidget(sep)
         right_group.addSpacing(4)
 
         # Admin + user avatar
         admin_label = QLabel("Admin")
-        admin_label.setStyleSheet(
-            f"color: {COLORS['text_secondary']}; font-size: 11px; font-weight: 500; background: transparent;"
-        )
+        admin_label.setObjectName("userName")
         right_group.addWidget(admin_label)
 
         avatar = QLabel("\U0001F464")  # 👤
         avatar.setFixedSize(28, 28)
         avatar.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        avatar.setStyleSheet(
-            f"background: {COLORS['bg_surface']}; border: 1px solid {COLORS['border_light']}; "
-            f"border-radius: 14px; font-size: 13px;"
-        )
+        avatar.setObjectName("userAvatar")
         right_group.addWidget(avatar)
 
         right_widget = QWidget()
         right_widget.setLayout(right_group)
-        right_widget.setStyleSheet("background: transparent;")
+        right_widget.setProperty("class", "bar-group")
         nav_layout.addWidget(right_widget)
 
         # Set as menu bar area (above central widget)
@@ -403,14 +546,14 @@ class MainWindow(QMainWindow):
         self._splitter.setStretchFactor(1, 1)
         self._splitter.setStretchFactor(2, 0)
 
-        # Dataset panel (shown when Dataset tab is active)
-        self._dataset_panel = DatasetPanel()
-        self._dataset_panel.set_refresh_callback(self._refresh_dataset)
+        # Dataset panel (shown when Dataset tab is active) is built on first
+        # visit; an empty placeholder holds its slot until then
+        self._dataset_panel: Optional["DatasetPanel"] = None
 
         # Stack: index 0 = Project view (splitter), index 1 = Dataset view
         self._main_stack = QStackedWidget()
         self._main_stack.addWidget(self._splitter)
-        self._main_stack.addWidget(self._dataset_panel)
+        self._main_stack.addWidget(QWidget())
 
         main_layout.addWidget(self._main_stack, 1)
 
@@ -418,46 +561,36 @@ class MainWindow(QMainWindow):
         """Build the bottom status bar matching the Figma footer."""
         self._status_bar = QStatusBar()
         self._status_bar.setFixedHeight(24)
-        self._status_bar.setStyleSheet(
-            f"QStatusBar {{ "
-            f"  background: {COLORS['bg_darkest']}; "
-            f"  border-top: 1px solid {COLORS['border']}; "
-            f"  color: {COLORS['text_dim']}; "
-            f"  font-size: 10px; "
-            f"  font-weight: 500; "
-            f"  padding: 0 4px; "
-            f"}} "
-            f"QStatusBar::item {{ border: none; }}"
-        )
+        self._status_bar.setObjectName("statusBar")
         self.setStatusBar(self._status_bar)
 
         # Left side: connection indicator + queue
         left_container = QWidget()
-        left_container.setStyleSheet("background: transparent;")
+        left_container.setProperty("class", "bar-group")
         left_layout = QHBoxLayout(left_container)
         left_layout.setContentsMargins(8, 0, 0, 0)
         left_layout.setSpacing(0)
 
         # Emerald dot
         conn_dot = QLabel("\u2022")
-        conn_dot.setStyleSheet(f"color: {COLORS['success']}; font-size: 12px; padding-right: 4px; background: transparent;")
+        conn_dot.setObjectName("connDot")
         left_layout.addWidget(conn_dot)
         self._conn_dot = conn_dot
 
         # Connection text
         self._conn_label = QLabel("Connected to Local Node: 127.0.0.1:8188")
-        self._conn_label.setStyleSheet(f"color: {COLORS['text_dim']}; font-size: 10px; background: transparent;")
+        self._conn_label.setProperty("class", "status-text")
         left_layout.addWidget(self._conn_label)
 
         # Separator
         sep1 = QFrame()
         sep1.setFixedSize(1, 12)
-        sep1.setStyleSheet(f"background: {COLORS['border']}; margin: 0 8px;")
+        sep1.setObjectName("statusSeparator")
         left_layout.addWidget(sep1)
 
         # Queue info
         self._queue_label = QLabel("")
-        self._queue_label.setStyleSheet(f"color: {COLORS['text_dim']}; font-size: 10px; background: transparent;")
+        self._queue_label.setProperty("class", "status-text")
         left_layout.addWidget(self._queue_label)
 
         self._status_bar.addWidget(left_container)
@@ -465,7 +598,7 @@ class MainWindow(QMainWindow):
         # Spacer
         spacer = QWidget()
         spacer.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-        spacer.setStyleSheet("background: transparent;")
+        spacer.setProperty("class", "bar-group")
         self._status_bar.addWidget(spacer)
 
         # Progress bar (hidden by default)
@@ -473,47 +606,36 @@ class MainWindow(QMainWindow):
         self._progress_bar.setFixedWidth(200)
         self._progress_bar.setFixedHeight(4)
         self._progress_bar.setVisible(False)
-        self._progress_bar.setStyleSheet(
-            f"QProgressBar {{ "
-            f"  background: {COLORS['bg_surface']}; "
-            f"  border: none; border-radius: 2px; "
-            f"}} "
-            f"QProgressBar::chunk {{ "
-            f"  background: {COLORS['accent']}; "
-            f"  border-radius: 2px; "
-            f"}}"
-        )
+        self._progress_bar.setObjectName("batchProgress")
         self._status_bar.addPermanentWidget(self._progress_bar)
 
         # Right side: inference time + RAM + UTF-8
         right_container = QWidget()
-        right_container.setStyleSheet("background: transparent;")
+        right_container.setProperty("class", "bar-group")
         right_layout = QHBoxLayout(right_container)
         right_layout.setContentsMargins(0, 0, 8, 0)
         right_layout.setSpacing(12)
 
         self._inference_label = QLabel("")
-        self._inference_label.setStyleSheet(f"color: {COLORS['text_dim']}; font-size: 10px; background: transparent;")
+        self._inference_label.setProperty("class", "status-text")
         right_layout.addWidget(self._inference_label)
 
         self._ram_label = QLabel("")
-        self._ram_label.setStyleSheet(f"color: {COLORS['text_dim']}; font-size: 10px; background: transparent;")
+        self._ram_label.setProperty("class", "status-text")
         right_layout.addWidget(self._ram_label)
 
         utf8_label = QLabel("UTF-8")
-        utf8_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 10px; background: transparent;")
+        utf8_label.setObjectName("encodingLabel")
         right_layout.addWidget(utf8_label)
 
         self._status_bar.addPermanentWidget(right_container)
 
-        # Update RAM info on start
-        self._update_ram_info()
-
     def _connect_signals(self):
         """Wire up all component signals."""
         # File browser -> display
         self._file_browser.image_selected.connect(self._on_image_selected)
         self._file_browser.clear_requested.connect(self._on_clear_all)
+        self._file_browser.images_imported.connect(self._invalidate_sidecar_listing)
 
         # Caption panel
         self._caption_panel.regenerate_requested.connect(self._generate_caption)
@@ -544,33 +666,65 @@ class MainWindow(QMainWindow):
     def _on_image_selected(self, path: Path):
         """Handle image selection from the file browser."""
         self._current_image = path
-        self._image_viewer.set_image(path)
+        self._image_viewer.set_image(path, self._file_browser.get_neighbors(path))
 
         # Show existing caption if available
         key = str(path)
         if key in self._captions:
+            self._captions.move_to_end(key)
             self._caption_panel.set_caption(self._captions[key])
         else:
             # Check for existing .txt sidecar
-            txt_path = path.with_suffix(".txt")
-            if txt_path.exists():
+            if self._has_sidecar(path):
                 try:
-                    caption = txt_path.read_text(encoding="utf-8").strip()
-                    self._captions[key] = caption
+                    with open(path.with_suffix(".txt"), "rb") as f:
+                        # Same text read_text() would give (newlines normalised)
+                        caption = f.read().decode("utf-8").replace("\r\n", "\n").strip()
+                    self._cache_caption(key, caption, saved=True)
                     self._caption_panel.set_caption(caption)
                 except Exception:
                     self._caption_panel.clear_caption()
             else:
                 self._caption_panel.clear_caption()
 
+    def _has_sidecar(self, path: Path) -> bool:
+        """Whether *path* has a caption .txt, from a cached listing of its folder."""
+        folder = path.parent
+        if folder != self._sidecar_folder:
+            try:
+                with os.scandir(folder) as it:
+                    names = {
+                        os.path.normcase(e.name)
+                        for e in it if e.name.lower().endswith(".txt")
+                    }
+            except OSError:
+                names = set()
+            self._sidecar_folder = folder
+            self._sidecar_names = names
+        return os.path.normcase(path.stem + ".txt") in self._sidecar_names
+
+    def _note_sidecar_written(self, image_path: Path):
+        """Keep the cached folder listing in step with sidecars we write."""
+        if image_path.parent == self._sidecar_folder:
+            self._sidecar_names.add(os.path.normcase(image_path.stem + ".txt"))
+
+    def _invalidate_sidecar_listing(self, *_):
+        self._sidecar_folder = None
+        self._sidecar_names = set()
+
     def _on_clear_all(self):
         """Reset the workspace — clear all images, captions, and viewer state."""
         # Cancel any in-progress batch
+        if isinstance(self._caption_worker, BatchCaptionWorker) and self._is_generating:
+            self._caption_worker.cancel()
+            self._batch_cancelled = True
         self._batch_queue.clear()
         self._batch_index = 0
 
         # Clear captions cache
         self._captions.clear()
+        self._unsaved_captions.clear()
+        self._invalidate_sidecar_listing()
         self._current_image = None
 
         # Reset viewer and caption panel
@@ -585,9 +739,19 @@ class MainWindow(QMainWindow):
 
     # --- Model Loading ---
 
+    def _get_engine(self) -> "Qwen3VLEngine":
+        """Return the inference engine, importing and creating it on first use."""
+        if self._engine is None:
+            from engine.inference import Qwen3VLEngine
+            self._engine = Qwen3VLEngine()
+        return self._engine
+
+    def _engine_loaded(self) -> bool:
+        return self._engine is not None and self._engine.is_loaded
+
     def _load_model(self):
         """Load the GGUF model in a background thread."""
-        if self._engine.is_loaded:
+        if self._engine_loaded():
             return
 
         # Find model file
@@ -605,10 +769,13 @@ class MainWindow(QMainWindow):
         model_dir = model_path.parent
         self._settings_panel.set_model_status("Checking for vision encoder...")
 
+        from gui.config import get_load_options, get_mmproj_quant
+        from engine.model_downloader import ensure_mmproj
         try:
             mmproj_path = ensure_mmproj(
                 model_dir,
                 progress_callback=lambda msg, _: self._settings_panel.set_model_status(msg),
+                quant=get_mmproj_quant(),
             )
         except Exception as e:
             QMessageBox.critical(
@@ -625,15 +792,15 @@ class MainWindow(QMainWindow):
 
         # Store as instance attrs to prevent garbage collection (QThread crash fix)
         self._model_load_thread = QThread()
-        self._model_load_worker = ModelLoadWorker(self._engine, model_path, mmproj_path)
+        self._model_load_worker = ModelLoadWorker(
+            self._get_engine(), model_path, mmproj_path, load_options=get_load_options(),
+        )
         self._model_load_worker.moveToThread(self._model_load_thread)
 
         self._model_load_thread.started.connect(self._model_load_worker.run)
-        self._model_load_worker.progress.connect(
-            lambda msg: self._settings_panel.set_model_status(msg)
-        )
-        self._model_load_worker.finished.connect(self._on_model_loaded)
-        self._model_load_worker.error.connect(self._on_model_load_error)
+        self._model_load_worker.progress.connect(self._settings_panel.set_model_status, _QUEUED)
+        self._model_load_worker.finished.connect(self._on_model_loaded, _QUEUED)
+        self._model_load_worker.error.connect(self._on_model_load_error, _QUEUED)
         self._model_load_worker.finished.connect(self._model_load_thread.quit)
         self._model_load_worker.error.connect(self._model_load_thread.quit)
 
@@ -651,7 +818,7 @@ class MainWindow(QMainWindow):
         self._set_connection_status("ready", "Model ready")
         self._settings_panel.model_combo.setEnabled(False)  # Must unload before switching
         self._update_gpu_info()
-        if not self._gpu_timer.isActive():
+        if self._polling_enabled() and not self._gpu_timer.isActive() and not self.isMinimized():
             self._gpu_timer.start()
         self._notify(f"{model_name} loaded successfully", "success")
 
@@ -665,7 +832,7 @@ class MainWindow(QMainWindow):
 
     def _unload_model(self):
         """Unload the current model and reset UI state."""
-        if not self._engine.is_loaded:
+        if not self._engine_loaded():
             return
 
         # Don't unload while generating
@@ -689,7 +856,7 @@ class MainWindow(QMainWindow):
 
     def _show_engine_status(self):
         """Show engine status info in a dialog (terminal icon action)."""
-        info = self._engine.get_model_info()
+        info = self._engine.get_model_info() if self._engine is not None else {}
         lines = [f"{k}: {v}" for k, v in info.items()]
         msg = "\n".join(lines) if lines else "No model loaded."
         QMessageBox.information(self, "Engine Status", msg)
@@ -699,6 +866,7 @@ class MainWindow(QMainWindow):
         from gui.app_settings_dialog import AppSettingsDialog
         dlg = AppSettingsDialog(self)
         dlg.theme_changed.connect(self._on_theme_changed)
+        dlg.poll_interval_changed.connect(self._gpu_timer.setInterval)
         dlg.exec()
 
     def _on_theme_changed(self, mode: str):
@@ -717,7 +885,7 @@ class MainWindow(QMainWindow):
         from gui.model_download_manager import (
             get_model_info, model_file_exists, ModelDownloadWorker,
         )
-        from gui.config import get_hf_token
+        from gui.config import get_hf_token, get_mmproj_quant
 
         info = get_model_info(model_name)
         if info is None:
@@ -769,13 +937,14 @@ class MainWindow(QMainWindow):
             filename=info["filename"],
             target_dir=target_dir,
             hf_token=token,
+            mmproj_quant=get_mmproj_quant(),
         )
         self._download_worker.moveToThread(self._download_thread)
 
         self._download_thread.started.connect(self._download_worker.run)
-        self._download_worker.progress.connect(self._on_download_progress)
-        self._download_worker.finished.connect(self._on_download_finished)
-        self._download_worker.error.connect(self._on_download_error)
+        self._download_worker.progress.connect(self._on_download_progress, _QUEUED)
+        self._download_worker.finished.connect(self._on_download_finished, _QUEUED)
+        self._download_worker.error.connect(self._on_download_error, _QUEUED)
         self._download_worker.finished.connect(self._download_thread.quit)
         self._download_worker.error.connect(self._download_thread.quit)
 
@@ -835,6 +1004,7 @@ class MainWindow(QMainWindow):
 
     def _find_model_file(self) -> Optional[Path]:
         """Search for the GGUF model file matching the selected combo entry."""
+        from gui.config import get_model_search_paths
         from gui.model_download_manager import get_model_info
 
         # Try to match the specific model selected in the dropdown
@@ -842,7 +1012,7 @@ class MainWindow(QMainWindow):
         model_info = get_model_info(combo_text)
         target_filename = model_info["filename"] if model_info else None
 
-        search_dirs = []
+        search_dirs = [Path(p) for p in get_model_search_paths()]
         if self._model_dir:
             search_dirs.append(self._model_dir)
 
@@ -874,7 +1044,7 @@ class MainWindow(QMainWindow):
 
     def _generate_caption(self):
         """Generate caption for the current image."""
-        if not self._engine.is_loaded:
+        if not self._engine_loaded():
             QMessageBox.warning(self, "Model Required", "Please load the model first.")
             return
 
@@ -907,9 +1077,9 @@ class MainWindow(QMainWindow):
         self._caption_worker.moveToThread(self._generation_thread)
 
         self._generation_thread.started.connect(self._caption_worker.run)
-        self._caption_worker.new_token.connect(self._caption_panel.append_token)
-        self._caption_worker.finished.connect(self._on_caption_finished)
-        self._caption_worker.error.connect(self._on_caption_error)
+        self._caption_worker.new_token.connect(self._caption_panel.append_token, _QUEUED)
+        self._caption_worker.finished.connect(self._on_caption_finished, _QUEUED)
+        self._caption_worker.error.connect(self._on_caption_error, _QUEUED)
         self._caption_worker.finished.connect(self._generation_thread.quit)
         self._caption_worker.error.connect(self._generation_thread.quit)
 
@@ -922,11 +1092,14 @@ class MainWindow(QMainWindow):
         # Cancel active caption worker
         if self._caption_worker and self._is_generating:
             self._caption_worker.cancel()
+            if isinstance(self._caption_worker, BatchCaptionWorker):
+                self._batch_cancelled = True
             cancelled_something = True
 
         # Cancel batch queue
         if self._batch_queue:
             remaining = len(self._batch_queue)
+            self._batch_cancelled = True
             self._batch_queue.clear()
             self._batch_index = 0
             self._progress_bar.setVisible(False)
@@ -955,7 +1128,7 @@ class MainWindow(QMainWindow):
 
         # Cache the caption
         if self._current_image:
-            self._captions[str(self._current_image)] = caption
+            self._cache_caption(str(self._current_image), caption, saved=False)
             self._file_browser.set_item_caption(self._current_image, caption)
             self._file_browser.set_item_status(self._current_image, "done")
 
@@ -966,15 +1139,8 @@ class MainWindow(QMainWindow):
 
         self._set_connection_status("ready", "Ready")
 
-        # ── Auto-Save popup ──
-        # If we're in a batch, auto-save silently; otherwise ask the user.
-        if self._batch_queue:
-            # During batch: auto-save each completed caption silently
-            self._auto_save_caption(self._current_image, caption)
-            self._process_next_batch_item()
-        else:
-            # Single image or last batch item: ask user
-            self._prompt_auto_save(caption)
+        # ── Auto-Save popup ── (batch captions are saved silently elsewhere)
+        self._prompt_auto_save(caption)
 
     def _prompt_auto_save(self, caption: str):
         """Show a Yes/No dialog asking whether to auto-save the caption file."""
@@ -1001,7 +1167,8 @@ class MainWindow(QMainWindow):
         txt_path = image_path.with_suffix(".txt")
         try:
             txt_path.write_text(caption, encoding="utf-8")
-            self._captions[str(image_path)] = caption
+            self._note_sidecar_written(image_path)
+            self._cache_caption(str(image_path), caption, saved=True)
             self._file_browser.set_item_status(image_path, "done")
             self._caption_panel.show_feedback(f"Saved: {txt_path.name}")
         except Exception as e:
@@ -1032,11 +1199,12 @@ class MainWindow(QMainWindow):
 
     def _set_connection_status(self, state: str, text: str):
         """Update status bar connection indicator. state: ready|loading|generating|error"""
-        color_map = {
-            "ready": COLORS["success"],
-            "loading": COLORS["warning"],
-            "generating": COLORS["warning"],
-            "error": COLORS["error"],
+        # Colour comes from the app stylesheet via QLabel#connDot[state=...]
+        style_map = {
+            "ready": "ready",
+            "loading": "busy",
+            "generating": "busy",
+            "error": "error",
         }
         icon_map = {
             "ready": "\u2022",       # ●
@@ -1044,12 +1212,10 @@ class MainWindow(QMainWindow):
             "generating": "\u26A1",  # ⚡
             "error": "\u2022",       # ●
         }
-        color = color_map.get(state, COLORS["text_dim"])
         icon = icon_map.get(state, "\u2022")
 
-        self._conn_dot.setStyleSheet(f"color: {color}; font-size: 12px; padding-right: 4px; background: transparent;")
+        self._set_style_state(self._conn_dot, "state", style_map.get(state, "idle"))
         self._conn_label.setText(text)
-        self._conn_label.setStyleSheet(f"color: {COLORS['text_dim']}; font-size: 10px; background: transparent;")
 
     # --- Settings Change Handler ---
 
@@ -1067,10 +1233,13 @@ class MainWindow(QMainWindow):
 
     def _batch_caption_all(self):
         """Start batch captioning for all imported images."""
-        if not self._engine.is_loaded:
+        if not self._engine_loaded():
             QMessageBox.warning(self, "Model Required", "Please load the model first.")
             return
 
+        if self._is_generating:
+            return
+
         all_paths = self._file_browser.get_all_paths()
         if not all_paths:
             QMessageBox.warning(self, "No Images", "Please import images first.")
@@ -1078,6 +1247,7 @@ class MainWindow(QMainWindow):
 
         self._batch_queue = list(all_paths)
         self._batch_index = 0
+        self._batch_cancelled = False
 
         # Mark all as queued
         for p in self._batch_queue:
@@ -1088,28 +1258,89 @@ class MainWindow(QMainWindow):
         self._progress_bar.setVisible(True)
         self._queue_label.setText(f"Queue: {len(self._batch_queue)} remaining")
 
-        self._process_next_batch_item()
+        self._is_generating = True
+        self._caption_panel.set_generating(True)
+        self._settings_panel.set_generating(True)
+        self._image_viewer.set_processing(True)
+        self._set_connection_status("generating", "Generating...")
 
-    def _process_next_batch_item(self):
-        """Process the next image in the batch queue."""
-        if not self._batch_queue:
-            self._on_batch_complete()
-            return
+        # One worker for the whole batch so preprocessing overlaps inference
+        self._generation_thread = QThread()
+        self._caption_worker = BatchCaptionWorker(
+            engine=self._engine,
+            image_paths=self._batch_queue,
+            prompt=self._settings_panel.get_prompt(),
+            temperature=self._settings_panel.get_temperature(),
+            top_p=self._settings_panel.get_top_p(),
+            max_tokens=self._settings_panel.get_max_tokens(),
+            prefix=self._settings_panel.get_prefix(),
+            suffix=self._settings_panel.get_suffix(),
+        )
+        self._caption_worker.moveToThread(self._generation_thread)
 
-        path = self._batch_queue.pop(0)
+        self._generation_thread.started.connect(self._caption_worker.run)
+        self._caption_worker.item_started.connect(self._on_batch_item_started, _QUEUED)
+        self._caption_worker.new_token.connect(self._caption_panel.append_token, _QUEUED)
+        self._caption_worker.item_finished.connect(self._on_batch_item_finished, _QUEUED)
+        self._caption_worker.finished.connect(self._on_batch_finished, _QUEUED)
+        self._caption_worker.error.connect(self._on_caption_error, _QUEUED)
+        self._caption_worker.finished.connect(self._generation_thread.quit)
+        self._caption_worker.error.connect(self._generation_thread.quit)
+
+        self._generation_thread.start()
+
+    def _on_batch_item_started(self, path: Path):
+        """Update the UI when the batch worker moves on to the next image."""
+        if self._batch_queue and self._batch_queue[0] == path:
+            self._batch_queue.pop(0)
         self._batch_index += 1
 
-        # Update UI
         self._file_browser.set_item_status(path, "processing")
         self._file_browser.select_item(path)
+        self._caption_panel.clear_caption()
         self._settings_panel.set_batch_progress(
             self._batch_index, self._batch_index + len(self._batch_queue)
         )
         self._progress_bar.setValue(self._batch_index)
         self._queue_label.setText(f"Queue: {len(self._batch_queue)} remaining")
 
-        # Generate (will call _process_next_batch_item on finish via _on_caption_finished)
-        QTimer.singleShot(100, self._generate_caption)
+    def _on_batch_item_finished(self, path: Path, caption: str):
+        """Cache and silently save one finished batch caption."""
+        self._cache_caption(str(path), caption, saved=False)
+        self._file_browser.set_item_caption(path, caption)
+        self._file_browser.set_item_status(path, "done")
+
+        inf_time = self._engine.last_inference_time
+        self._settings_panel.set_inference_time(inf_time)
+        self._inference_label.setText(f"Inference: {inf_time:.1f}s")
+
+        if caption:
+            self._io_pool.start(_SidecarWriteTask(self._sidecar_signals, path, caption))
+
+    def _on_sidecar_written(self, path: Path, caption: str):
+        """A background sidecar write finished."""
+        self._note_sidecar_written(path)
+        key = str(path)
+        if self._captions.get(key) == caption:   # not re-generated/edited meanwhile
+            self._unsaved_captions.discard(key)
+        self._file_browser.set_item_status(path, "done")
+        self._caption_panel.show_feedback(f"Saved: {path.with_suffix('.txt').name}")
+
+    def _on_sidecar_failed(self, path: Path, error: str):
+        self._caption_panel.show_feedback(f"Save error: {error}", is_success=False)
+
+    def _on_batch_finished(self):
+        """Handle the batch worker exiting (completed or cancelled)."""
+        self._is_generating = False
+        self._caption_panel.set_generating(False)
+        self._settings_panel.set_generating(False)
+        self._image_viewer.set_processing(False)
+        self._set_connection_status("ready", "Ready")
+
+        if self._batch_cancelled:
+            self._batch_cancelled = False
+            return
+        self._on_batch_complete()
 
     def _on_batch_complete(self):
         """Handle batch completion."""
@@ -1135,6 +1366,20 @@ class MainWindow(QMainWindow):
 
     # --- Save / Export ---
 
+    def _cache_caption(self, key: str, caption: str, saved: bool):
+        """Store *caption* as most recently used, evicting the oldest saved entries."""
+        self._captions[key] = caption
+        self._captions.move_to_end(key)
+        if saved:
+            self._unsaved_captions.discard(key)
+        else:
+            self._unsaved_captions.add(key)
+        while len(self._captions) > _MAX_CAPTION_CACHE:
+            victim = next((k for k in self._captions if k not in self._unsaved_captions), None)
+            if victim is None:
+                break  # everything left is unsaved work — keep it
+            del self._captions[victim]
+
     def _save_current_caption(self):
         """Save the current caption as a .txt sidecar file."""
         if not self._current_image:
@@ -1148,7 +1393,8 @@ class MainWindow(QMainWindow):
         txt_path = self._current_image.with_suffix(".txt")
         try:
             txt_path.write_text(caption, encoding="utf-8")
-            self._captions[str(self._current_image)] = caption
+            self._note_sidecar_written(self._current_image)
+            self._cache_caption(str(self._current_image), caption, saved=True)
             self._caption_panel.show_feedback(f"Saved: {txt_path.name}")
             self._file_browser.set_item_status(self._current_image, "done")
         except Exception as e:
@@ -1170,6 +1416,8 @@ class MainWindow(QMainWindow):
                 img_path = Path(path_str)
                 txt_path = img_path.with_suffix(".txt")
                 txt_path.write_text(caption, encoding="utf-8")
+                self._note_sidecar_written(img_path)
+                self._unsaved_captions.discard(path_str)
                 saved += 1
             except Exception:
                 errors += 1
@@ -1185,19 +1433,32 @@ class MainWindow(QMainWindow):
     def _switch_tab(self, tab_name: str):
         """Switch between Project and Dataset views."""
         for name, btn in self._tab_buttons.items():
-            if name == tab_name:
-                btn.setProperty("class", "nav-tab-active")
-            else:
-                btn.setProperty("class", "nav-tab")
+            cls = "nav-tab-active" if name == tab_name else "nav-tab"
+            if btn.property("class") == cls:
+                continue  # only re-resolve QSS for buttons whose state changed
+            btn.setProperty("class", cls)
             btn.style().unpolish(btn)
             btn.style().polish(btn)
 
         if tab_name == "Dataset":
+            self._ensure_dataset_panel()
             self._main_stack.setCurrentIndex(1)
             self._refresh_dataset()
         else:
             self._main_stack.setCurrentIndex(0)
 
+    def _ensure_dataset_panel(self):
+        """Build the Dataset tab on first visit, replacing its placeholder."""
+        if self._dataset_panel is not None:
+            return
+        from gui.dataset_panel import DatasetPanel
+        self._dataset_panel = DatasetPanel()
+        self._dataset_panel.set_refresh_callback(self._refresh_dataset)
+        placeholder = self._main_stack.widget(1)
+        self._main_stack.insertWidget(1, self._dataset_panel)
+        self._main_stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+
     def _refresh_dataset(self):
         """Populate the dataset panel from the file browser's loaded images."""
         paths = self._file_browser.get_all_paths()
@@ -1207,60 +1468,90 @@ class MainWindow(QMainWindow):
 
     def _init_nvml(self):
         """Initialize NVIDIA Management Library for real VRAM monitoring."""
-        self._pynvml = None
-        try:
-            import warnings
-            with warnings.catch_warnings():
-                warnings.filterwarnings("ignore", category=FutureWarning, module="pynvml")
-                import pynvml
-            self._pynvml = pynvml
-            pynvml.nvmlInit()
-            self._nvml_handle = pynvml.nvmlDeviceGetHandleByIndex(0)
-        except Exception:
-            self._nvml_handle = None
+        self._nvml_available = gpu_stats.init_nvml()
+
+    def _retry_nvml(self):
+        """Deferred second attempt at NVML init (e.g. driver loaded after startup)."""
+        if self._nvml_available:
+            return
+        self._init_nvml()
+        if self._nvml_available:
+            self._update_gpu_info()
+            if not self._gpu_timer.isActive() and not self.isMinimized():
+                self._gpu_timer.start()
 
     def _update_gpu_info(self):
-        """Update GPU/VRAM display in the nav bar pill using pynvml."""
-        if self._nvml_handle is not None and self._pynvml is not None:
-            try:
-                mem_info = self._pynvml.nvmlDeviceGetMemoryInfo(self._nvml_handle)
-                mem_used_gb = mem_info.used / (1024 ** 3)
-                mem_total_gb = mem_info.total / (1024 ** 3)
-                pct = int(mem_info.used / mem_info.total * 100) if mem_info.total > 0 else 0
+        """Update GPU/VRAM display in the nav bar pill from the shared GPU snapshot."""
+        if self._nvml_available:
+            snap = gpu_stats.get_gpu_snapshot()
+            if snap is not None:
+                total = snap.mem_total_mb
+                pct = int(snap.mem_used_mb / total * 100) if total > 0 else 0
 
                 self._gpu_label.setText(f"GPU: {pct}%")
-                self._vram_label.setText(f"{mem_used_gb:.1f}/{mem_total_gb:.0f}GB")
+                self._vram_label.setText(f"{snap.mem_used_mb / 1024:.1f}/{total / 1024:.0f}GB")
 
                 # Color-code: green <70%, yellow 70-90%, red >90%
                 if pct >= 90:
-                    color = COLORS["error"]
+                    level = "high"
                 elif pct >= 70:
-                    color = COLORS["warning"]
+                    level = "warn"
                 else:
-                    color = COLORS["success"]
-
-                self._gpu_dot.setStyleSheet(f"color: {color}; font-size: 14px; background: transparent;")
-                self._gpu_label.setStyleSheet(
-                    f"color: {color}; font-size: 10px; font-weight: 600; "
-                    f"letter-spacing: 0.5px; text-transform: uppercase; background: transparent;"
-                )
+                    level = "ok"
+                self._set_gpu_level(level)
                 return
-            except Exception:
-                pass
+            # Device lost mid-session — stop polling instead of re-hitting
+            # a failing driver call every tick
+            self._nvml_available = False
+            if not self._polling_enabled():
+                self._gpu_timer.stop()
 
-        self._gpu_label.setText("GPU: Active")
+        self._gpu_label.setText("GPU: N/A")
         self._vram_label.setText("VRAM: N/A")
+        self._set_gpu_level("na")
+
+    def _set_gpu_level(self, level: str):
+        """Recolour the GPU dot/label via the app stylesheet's [level=...] rules."""
+        self._set_style_state(self._gpu_dot, "level", level)
+        self._set_style_state(self._gpu_label, "level", level)
+
+    @staticmethod
+    def _set_style_state(widget: QWidget, name: str, value: str):
+        """Set a QSS-selector property and re-polish, only if it changed."""
+        if widget.property(name) == value:
+            return
+        widget.setProperty(name, value)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+
+    def changeEvent(self, event):
+        """Pause GPU polling while minimized; refresh and resume on restore."""
+        if event.type() == QEvent.Type.WindowStateChange:
+            if self.isMinimized():
+                self._gpu_timer.stop()
+            elif self._polling_enabled() and not self._gpu_timer.isActive():
+                self._on_status_tick()
+                self._gpu_timer.start()
+        super().changeEvent(event)
+
+    def _polling_enabled(self) -> bool:
+        """True if the periodic status tick has anything to refresh."""
+        return self._nvml_available or PSUTIL_AVAILABLE
+
+    def _on_status_tick(self):
+        """Single periodic wakeup shared by the GPU pill and the RAM readout."""
+        if self._nvml_available:
+            self._update_gpu_info()
+        self._update_ram_info()
 
     def _update_ram_info(self):
-        """Update RAM display in the status bar."""
-        try:
-            import psutil
-            mem = psutil.virtual_memory()
-            used_gb = mem.used / (1024 ** 3)
-            total_gb = mem.total / (1024 ** 3)
-            self._ram_label.setText(f"RAM: {used_gb:.1f} / {total_gb:.0f} GB")
-        except ImportError:
-            self._ram_label.setText("")
+        """Update RAM display in the status bar (one psutil call, microseconds)."""
+        if not PSUTIL_AVAILABLE:
+            return
+        mem = psutil.virtual_memory()
+        used_gb = mem.used / (1024 ** 3)
+        total_gb = mem.total / (1024 ** 3)
+        self._ram_label.setText(f"RAM: {used_gb:.1f} / {total_gb:.0f} GB")
 
     # --- Cleanup ---
 
@@ -1283,15 +1574,15 @@ class MainWindow(QMainWindow):
             self._download_thread.quit()
             self._download_thread.wait(5000)
 
-        self._engine.unload()
+        # Let queued sidecar writes land before exit
+        self._io_pool.waitForDone(3000)
+
+        if self._engine is not None:
+            self._engine.unload()
+        if self._dataset_panel is not None:
+            self._dataset_panel.save_meta_cache()
 
-        # Shutdown pynvml
+        # Stop GPU polling (pynvml itself is shut down at interpreter exit)
         self._gpu_timer.stop()
-        if self._nvml_handle is not None and self._pynvml is not None:
-            try:
-                self._pynvml.nvmlShutdown()
-            except Exception:
-                pass
-            self._nvml_handle = None
 
         event.accept()
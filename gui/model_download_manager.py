@@ -153,12 +153,14 @@ class ModelDownloadWorker(QObject):
         filename: str,
         target_dir: Path,
         hf_token: str = "",
+        mmproj_quant: Optional[str] = None,
     ):
         super().__init__()
         self.repo_id = repo_id
         self.filename = filename
         self.target_dir = target_dir
         self.hf_token = hf_token or None
+        self.mmproj_quant = mmproj_quant  # also fetch the mmproj if it's missing
         self._cancelled = False
 
     def cancel(self):
@@ -167,6 +169,11 @@ class ModelDownloadWorker(QObject):
 
     def run(self):
         """Execute the download (call from a QThread)."""
+        from engine.model_downloader import (
+            MMPROJ_FILENAMES, MMPROJ_REPO_ID, download_model_bundle,
+            enable_hf_transfer, find_mmproj_file,
+        )
+        enable_hf_transfer()
         try:
             from huggingface_hub import hf_hub_download
         except ImportError:
@@ -186,13 +193,27 @@ class ModelDownloadWorker(QObject):
                 0.05,
             )
 
-            local_path = hf_hub_download(
-                repo_id=self.repo_id,
-                filename=self.filename,
-                local_dir=str(self.target_dir),
-                local_dir_use_symlinks=False,
-                token=self.hf_token,
-            )
+            mmproj_filename = MMPROJ_FILENAMES.get(self.mmproj_quant or "")
+            if (
+                mmproj_filename
+                and self.repo_id == MMPROJ_REPO_ID
+                and find_mmproj_file(Path(self.target_dir), self.mmproj_quant) is None
+            ):
+                # Model + vision encoder in one concurrent snapshot download
+                download_model_bundle(
+                    self.target_dir, self.repo_id,
+                    [self.filename, mmproj_filename],
+                    progress_callback=lambda msg, frac: self.progress.emit(msg, frac),
+                    token=self.hf_token,
+                )
+                local_path = Path(self.target_dir) / self.filename
+            else:
+                local_path = hf_hub_download(
+                    repo_id=self.repo_id,
+                    filename=self.filename,
+                    local_dir=str(self.target_dir),
+                    token=self.hf_token,
+                )
 
             if self._cancelled:
                 self.error.emit("Download cancelled.")
@@ -356,7 +356,7 @@ def get_stylesheet(mode: str = "dark") -> str:
     }}
 
     /* Monospace caption editor */
-    QTextEdit[class="caption-editor"] {{
+    QPlainTextEdit[class="caption-editor"] {{
         background-color: rgba(24, 24, 27, 0.5);
         border: 1px solid {c['border']};
         border-radius: 8px;
@@ -365,7 +365,7 @@ def get_stylesheet(mode: str = "dark") -> str:
         font-size: 13px;
         line-height: 1.6;
     }}
-    QTextEdit[class="caption-editor"]:focus {{
+    QPlainTextEdit[class="caption-editor"]:focus {{
         border-color: rgba(37, 99, 235, 0.5);
     }}
 
@@ -608,19 +608,12 @@ def get_stylesheet(mode: str = "dark") -> str:
         padding: 4px 12px;
     }}
 
-    /* Thumbnail items */
-    QFrame[class="thumbnail-item"] {{
-        background-color: transparent;
-        border-left: 2px solid transparent;
-        padding: 4px;
-    }}
-    QFrame[class="thumbnail-item"]:hover {{
-        background-color: {c['bg_dark']};
-    }}
-    QFrame[class="thumbnail-selected"] {{
-        background-color: {c['accent_dim']};
-        border-left: 2px solid {c['accent']};
-        padding: 4px;
+    /* Thumbnail list (rows are painted by the file browser's delegate) */
+    QListView#fileList {{
+        background-color: {c['bg_darkest']};
+        border: none;
+        padding: 4px 0px;
+        outline: none;
     }}
 
     /* === TAB-LIKE NAV BUTTONS === */
@@ -647,6 +640,122 @@ def get_stylesheet(mode: str = "dark") -> str:
         font-size: 12px;
     }}
 
+    /* === NAV BAR CONTENTS === */
+    QWidget[class="bar-group"] {{
+        background: transparent;
+    }}
+    QLabel#brandTitle {{
+        color: {c['text_primary']};
+        font-size: 13px;
+        font-weight: 700;
+        letter-spacing: 0.5px;
+        margin: 0;
+    }}
+    QLabel#brandSubtitle {{
+        color: {c['text_dim']};
+        font-size: 9px;
+        font-family: 'Consolas', 'Courier New', monospace;
+        letter-spacing: 0.3px;
+        margin: 0;
+        text-transform: uppercase;
+    }}
+    QLabel#gpuDot {{
+        font-size: 14px;
+    }}
+    QLabel#gpuLabel {{
+        font-size: 10px;
+        font-weight: 600;
+        letter-spacing: 0.5px;
+        text-transform: uppercase;
+    }}
+    QLabel#gpuDot, QLabel#gpuLabel {{
+        color: {c['success']};
+    }}
+    QLabel#gpuDot[level="warn"], QLabel#gpuLabel[level="warn"] {{
+        color: {c['warning']};
+    }}
+    QLabel#gpuDot[level="high"], QLabel#gpuLabel[level="high"] {{
+        color: {c['error']};
+    }}
+    QLabel#gpuDot[level="na"], QLabel#gpuLabel[level="na"] {{
+        color: {c['text_dim']};
+    }}
+    QLabel#vramLabel {{
+        color: {c['text_dim']};
+        font-size: 10px;
+        font-weight: 500;
+        letter-spacing: 0.5px;
+        text-transform: uppercase;
+    }}
+    QLabel#bellBadge {{
+        background-color: {c['error']};
+        color: #ffffff;
+        font-size: 9px;
+        font-weight: 700;
+        border-radius: 8px;
+        border: none;
+        padding: 0px;
+    }}
+    QLabel#userName {{
+        color: {c['text_secondary']};
+        font-size: 11px;
+        font-weight: 500;
+    }}
+    QLabel#userAvatar {{
+        background: {c['bg_surface']};
+        border: 1px solid {c['border_light']};
+        border-radius: 14px;
+        font-size: 13px;
+    }}
+
+    /* === STATUS BAR CONTENTS === */
+    QStatusBar#statusBar {{
+        background: {c['bg_darkest']};
+        border-top: 1px solid {c['border']};
+        color: {c['text_dim']};
+        font-size: 10px;
+        font-weight: 500;
+        padding: 0 4px;
+    }}
+    QStatusBar#statusBar::item {{
+        border: none;
+    }}
+    QLabel#connDot {{
+        color: {c['success']};
+        font-size: 12px;
+        padding-right: 4px;
+    }}
+    QLabel#connDot[state="busy"] {{
+        color: {c['warning']};
+    }}
+    QLabel#connDot[state="error"] {{
+        color: {c['error']};
+    }}
+    QLabel#connDot[state="idle"] {{
+        color: {c['text_dim']};
+    }}
+    QLabel[class="status-text"] {{
+        color: {c['text_dim']};
+        font-size: 10px;
+    }}
+    QLabel#encodingLabel {{
+        color: {c['text_secondary']};
+        font-size: 10px;
+    }}
+    QFrame#statusSeparator {{
+        background: {c['border']};
+        margin: 0 8px;
+    }}
+    QProgressBar#batchProgress {{
+        background: {c['bg_surface']};
+        border: none;
+        border-radius: 2px;
+    }}
+    QProgressBar#batchProgress::chunk {{
+        background: {c['accent']};
+        border-radius: 2px;
+    }}
+
     /* === TOOLTIP === */
     QToolTip {{
         background-color: {c['bg_dark']};
@@ -668,4 +777,109 @@ def get_stylesheet(mode: str = "dark") -> str:
         max-width: 1px;
         min-width: 1px;
     }}
+
+    /* === CAPTION PANEL === */
+    QPushButton#regenerateButton {{
+        border-radius: 6px;
+        padding: 6px 16px;
+        font-size: 12px;
+    }}
+    QLabel[class="format-dot"] {{
+        color: {c['accent']};
+        font-size: 8px;
+    }}
+    QLabel[class="caption-meta"] {{
+        color: {c['text_dim']};
+        font-size: 10px;
+    }}
+
+    /* === SETTINGS DIALOG === */
+    QDialog#appSettingsDialog {{
+        background-color: {c['bg_darkest']};
+        border: 1px solid {c['border_light']};
+        border-radius: 10px;
+    }}
+    QWidget#appSettingsBody,
+    QScrollArea#appSettingsScroll > QWidget#qt_scrollarea_viewport {{
+        background: transparent;
+    }}
+    QLineEdit#hfToken {{
+        background-color: {c['bg_dark']};
+        color: {c['text_primary']};
+        border: 1px solid {c['border']};
+        border-radius: 6px;
+        padding: 8px;
+        font-family: 'Consolas', monospace;
+        font-size: 12px;
+    }}
+    QLineEdit#hfToken:focus {{
+        border-color: {c['accent']};
+    }}
+    QPushButton#showTokenButton {{
+        background: {c['bg_hover']};
+        border: 1px solid {c['border']};
+        border-radius: 6px;
+        font-size: 14px;
+        padding: 0px;
+    }}
+    QPushButton#showTokenButton:hover {{
+        background: {c['bg_surface']};
+    }}
+    QListView#modelPaths {{
+        background-color: {c['bg_dark']};
+        color: {c['text_primary']};
+        border: 1px solid {c['border']};
+        border-radius: 6px;
+        padding: 4px;
+        font-size: 11px;
+    }}
+    QListView#modelPaths::item:selected {{
+        background: {c['bg_hover']};
+    }}
+    QLabel[class="dialog-title"] {{
+        color: {c['text_primary']};
+        font-size: 16px;
+        font-weight: 700;
+        background: transparent;
+        margin-bottom: 4px;
+    }}
+    QLabel[class="dialog-subtitle"], QLabel[class="settings-desc"] {{
+        color: {c['text_dim']};
+        font-size: 11px;
+        background: transparent;
+    }}
+    QLabel[class="settings-section"] {{
+        color: {c['text_dim']};
+        font-size: 10px;
+        font-weight: 700;
+        letter-spacing: 1.5px;
+        background: transparent;
+    }}
+    QLabel[class="settings-label"] {{
+        color: {c['text_secondary']};
+        font-size: 12px;
+        background: transparent;
+    }}
+    QLabel[class="settings-note"] {{
+        color: {c['text_muted']};
+        font-size: 10px;
+        background: transparent;
+        padding-left: 2px;
+    }}
+    QPushButton[class="path-button"], QPushButton[class="path-button-danger"] {{
+        background: {c['bg_hover']};
+        color: {c['text_secondary']};
+        border: 1px solid {c['border']};
+        border-radius: 6px;
+        padding: 5px 10px;
+        font-size: 11px;
+    }}
+    QPushButton[class="path-button"]:hover {{
+        background: {c['accent']};
+        color: white;
+    }}
+    QPushButton[class="path-button-danger"]:hover {{
+        background: {c['error']};
+        color: white;
+    }}
     """